@@ -4,7 +4,7 @@ Main interface for ADB operations, device management, and file transfers.
 """
 
 import os
-import sys
+import re
 import shutil
 import subprocess
 import logging
@@ -20,6 +20,7 @@ from .platform_tools import (
 from .platform_utils import get_platform_tools_directory, get_platform_type
 from .file_transfer import ADBFileTransfer
 from .adb_command import ADBCommandRunner
+from .adb_shell import PersistentAdbShell
 from .progress_tracker import ProgressTracker
 
 try:
@@ -33,10 +34,14 @@ except ImportError:
     from utils.security_utils import sanitize_android_path, validate_device_id
 
 
-OS_TYPE = sys.platform
-
 logger = logging.getLogger(__name__)
 
+# One `ls -la` line: permissions, links, owner, group, size, three date/time
+# fields, then the name (which may contain spaces)
+_LS_LINE_RE = re.compile(
+    r"^(\S+)\s+\S+\s+\S+\s+\S+\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+)$"
+)
+
 
 class ADBManager:
     """Main interface for ADB operations, device management, and file transfers."""
@@ -181,21 +186,18 @@ class ADBManager:
                 return []
             
             files = []
+            match_line = _LS_LINE_RE.match
             for line in stdout.split('\n'):
                 line = line.strip()
                 if not line or line.startswith('total '):
                     continue
                     
-                # Parse ls -la output
-                parts = line.split()
-                if len(parts) < 9:
+                # Parse ls -la output; lines with fewer than 9 fields don't match
+                m = match_line(line)
+                if not m:
                     continue
                     
-                permissions = parts[0]
-                size_str = parts[4]
-                
-                # Join filename parts (handles spaces in filenames)
-                name = ' '.join(parts[8:])
+                permissions, size_str, month, day, time_or_year, name = m.groups()
                 
                 # Skip current and parent directory entries
                 if name in ['.', '..']:
@@ -209,7 +211,7 @@ class ADBManager:
                     size = 0
                 
                 # Combine date and time parts
-                modified = ' '.join(parts[5:8]) if len(parts) >= 8 else ''
+                modified = f"{month} {day} {time_or_year}"
                 
                 files.append({
                     'name': name,
@@ -597,6 +599,13 @@ class ADBManager:
                 return None, str(e), -1
             return None
 
+    def open_shell(self) -> PersistentAdbShell:
+        """Open a persistent shell session on the selected device.
+
+        The caller owns the session and must close() it when done.
+        """
+        return PersistentAdbShell(self.selected_device)
+
     def check_device(self) -> Optional[str]:
         out, err, rc = self.run_adb_command(['devices'], capture_output=True)
         if rc != 0 or not out:
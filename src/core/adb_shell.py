@@ -0,0 +1,170 @@
+"""
+Persistent ADB shell sessions.
+Keeps one ``adb shell`` process alive so repeated commands skip the
+per-command adb connection and process startup cost.
+"""
+
+import queue
+import subprocess
+import threading
+import time
+from typing import Optional, Tuple
+
+from .platform_tools import get_adb_binary_path
+
+
+# Seconds a command may run before the session is killed; matches the
+# timeout run_adb_command uses for one-off commands
+COMMAND_TIMEOUT = 15.0
+
+
+class PersistentAdbShell:
+    """A long-lived ``adb shell`` process that runs commands one at a time.
+
+    Each command is followed by an ``echo`` of a sentinel carrying its exit
+    status, and output is read until that sentinel appears. Commands from
+    different threads are serialized on an internal lock.
+    """
+
+    SENTINEL = "__AFH_END_"
+
+    def __init__(self, device_id: Optional[str] = None):
+        """Initialize the shell session; the process starts on first use.
+
+        Args:
+            device_id: Optional device serial passed to adb with -s
+        """
+        self.device_id = device_id
+        self.process: Optional[subprocess.Popen] = None
+        self.closed = False
+        self._lock = threading.Lock()
+        # Lines read from the current process; None marks end of output
+        self._lines: Optional[queue.SimpleQueue] = None
+
+    def _start(self) -> subprocess.Popen:
+        """Start the adb shell process if it is not already running."""
+        if self.process is None or self.process.poll() is not None:
+            cmd = [get_adb_binary_path()]
+            if self.device_id:
+                cmd += ["-s", self.device_id]
+            cmd.append("shell")
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+            )
+            # A reader thread lets run() wait for output with a deadline
+            self._lines = queue.SimpleQueue()
+            threading.Thread(
+                target=self._read_lines,
+                args=(self.process.stdout, self._lines),
+                daemon=True,
+            ).start()
+        return self.process
+
+    @staticmethod
+    def _read_lines(stdout, lines: queue.SimpleQueue) -> None:
+        """Forward stdout lines to the queue until the process exits.
+
+        Args:
+            stdout: Output pipe of one shell process
+            lines: Queue that receives each line, then None at end of output
+        """
+        try:
+            for line in iter(stdout.readline, ""):
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            lines.put(None)
+
+    def run(
+        self, command: str, timeout: float = COMMAND_TIMEOUT
+    ) -> Tuple[Optional[str], str, int]:
+        """Run a shell command in the session and wait for it to finish.
+
+        stderr is merged into the command output; on failure the output is
+        also returned as the error text so callers can inspect it. A command
+        still running after timeout seconds kills the session process.
+
+        Args:
+            command: Shell command line to run on the device
+            timeout: Seconds to wait for the command to finish
+
+        Returns:
+            Tuple of (stdout, stderr, returncode), matching run_adb_command
+        """
+        with self._lock:
+            if self.closed:
+                return None, "adb shell session is closed", -1
+            try:
+                process = self._start()
+                process.stdin.write(f"{command} 2>&1; echo {self.SENTINEL}$?__\n")
+                process.stdin.flush()
+
+                deadline = time.monotonic() + timeout
+                lines = []
+                while True:
+                    try:
+                        line = self._lines.get(
+                            timeout=max(0.0, deadline - time.monotonic())
+                        )
+                    except queue.Empty:
+                        self._terminate()
+                        return None, "timeout", -1
+                    if line is None:
+                        raise RuntimeError("adb shell session ended unexpectedly")
+                    marker = line.find(self.SENTINEL)
+                    if marker != -1:
+                        if marker:
+                            lines.append(line[:marker])
+                        code = line[marker + len(self.SENTINEL):].strip().rstrip("_")
+                        returncode = int(code) if code.isdigit() else -1
+                        break
+                    lines.append(line)
+            except Exception as e:
+                self._terminate()
+                return None, str(e), -1
+
+        output = "".join(lines).rstrip("\n")
+        return output, "" if returncode == 0 else output, returncode
+
+    def _terminate(self) -> None:
+        """Stop the shell process without waiting for pending output."""
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            try:
+                process.kill()
+                process.wait(timeout=2)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Close the session, letting an idle shell exit cleanly.
+
+        A session still running a command is killed at once rather than
+        waited for, so closing never blocks the caller. Later run() calls
+        fail instead of starting a new process.
+        """
+        self.closed = True
+        if not self._lock.acquire(blocking=False):
+            # The running command's run() sees the end of output and returns
+            self._terminate()
+            return
+        try:
+            process = self.process
+            if process is None:
+                return
+            try:
+                if process.poll() is None:
+                    process.stdin.write("exit\n")
+                    process.stdin.flush()
+                    process.wait(timeout=2)
+            except Exception:
+                pass
+            self._terminate()
+        finally:
+            self._lock.release()
@@ -10,7 +10,7 @@ import re
 from typing import Optional, Tuple
 
 from .adb_command import ADBCommandRunner
-from .progress_tracker import ProgressTracker, TransferProgressEstimator
+from .progress_tracker import ProgressTracker, estimate_progress
 from .platform_tools import get_adb_binary_path
 from .platform_utils import is_windows
 
@@ -179,9 +179,8 @@ class ADBFileTransfer(ProgressTracker):
                         last_update_time = current_time
                     else:
                         # For single files, use simpler progress estimation
-                        estimated = TransferProgressEstimator.estimate_progress_from_time(
-                            start_time, last_progress, elapsed_threshold=1.0, 
-                            max_increment=20, max_progress=90
+                        estimated = estimate_progress(
+                            line_count, current_time - start_time, last_progress
                         )
                         if estimated is not None:
                             self.update_progress(estimated)
@@ -253,8 +252,8 @@ class ADBFileTransfer(ProgressTracker):
                                 files_transferred = int(match.group(1))
                         
                         # Update file transfer progress
-                        if self.transfer_progress['files_to_transfer'] > 0:
-                            self.update_transfer_progress(files_transferred, self.transfer_progress['files_to_transfer'])
+                        if self.files_to_transfer > 0:
+                            self.update_transfer_progress(files_transferred, self.files_to_transfer)
                     
                     pct = self.parse_progress(line)
 
@@ -270,8 +269,9 @@ class ADBFileTransfer(ProgressTracker):
                         new_progress = last_progress
 
                         if operation_name == "Transfer":  # Pull operation - more complex logic
-                            estimated = TransferProgressEstimator.estimate_complex_progress(
-                                line_count, elapsed_time, last_progress
+                            estimated = estimate_progress(
+                                line_count, elapsed_time, last_progress,
+                                complex_estimate=True
                             )
                             if estimated is not None and time_since_last_update >= 2.0:
                                 new_progress = estimated
@@ -281,9 +281,8 @@ class ADBFileTransfer(ProgressTracker):
                                 new_progress = min(last_progress + increment, 90)
                                 should_update = True
                         else:  # Push operation - simpler logic
-                            estimated = TransferProgressEstimator.estimate_progress_from_time(
-                                start_time, last_progress, elapsed_threshold=1.0,
-                                max_increment=20, max_progress=90
+                            estimated = estimate_progress(
+                                line_count, elapsed_time, last_progress
                             )
                             if estimated is not None:
                                 new_progress = estimated
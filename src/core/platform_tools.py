@@ -3,15 +3,14 @@ ADB platform tools management.
 Handles downloading, installing, and managing Android platform tools.
 """
 
+import hashlib
 import os
+import re
+import stat
 import sys
-import requests
-import zipfile
-import shutil
-import tempfile
 from typing import Optional
 
-from .platform_utils import get_adb_binary_name, get_platform_tools_directory, is_windows, is_linux
+from .platform_utils import IS_LINUX, IS_WINDOWS, get_adb_binary_name, get_platform_tools_directory
 
 
 # Constants for download URLs
@@ -22,8 +21,156 @@ ADB_LINUX_ZIP_URL = (
     "https://dl.google.com/android/repository/platform-tools-latest-linux.zip"
 )
 
+# Rejects zip member names that climb out of the extraction root (".." components),
+# are absolute, or carry a Windows drive letter.
+_UNSAFE_MEMBER_RE = re.compile(r"(^|[/\\])\.\.([/\\]|$)|^[/\\]|^[A-Za-z]:")
 
-def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest") -> str:
+
+def _plan_zip_extraction(infos: list, dest_dir: str,
+                         max_total_size: Optional[int] = None) -> list:
+    """Validate zip members and resolve each to its destination path.
+
+    Names are screened with a single regex first; only survivors are
+    normalized and prefix-checked against the resolved destination. The
+    uncompressed size limit is enforced in the same pass over the members.
+
+    Returns:
+        List of (ZipInfo, destination_path) tuples in archive order.
+
+    Raises:
+        RuntimeError: If any member would escape dest_dir, or the total
+            uncompressed size exceeds max_total_size.
+    """
+    dest_root = os.path.realpath(dest_dir)
+    dest_prefix = dest_root + os.sep
+    jobs = []
+    total_size = 0
+    for info in infos:
+        if max_total_size is not None:
+            total_size += info.file_size
+            if total_size > max_total_size:
+                raise RuntimeError("Zip archive uncompressed size exceeds safety limit")
+        name = info.filename
+        if _UNSAFE_MEMBER_RE.search(name):
+            raise RuntimeError(f"Zip contains path traversal: {name}")
+        target = os.path.normpath(os.path.join(dest_root, name))
+        if not (target.startswith(dest_prefix) or target == dest_root):
+            raise RuntimeError(f"Zip contains path traversal: {name}")
+        jobs.append((info, target))
+    return jobs
+
+
+_EXTRACT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+
+def _extract_zip_members(zf, jobs: list, executable_name: Optional[str] = None) -> None:
+    """Extract pre-validated (ZipInfo, destination_path) jobs from an open archive.
+
+    Files are written through raw file descriptors with no per-file fsync;
+    durability comes from the single rename that publishes the install.
+    Files named executable_name are made executable through the same
+    descriptor on POSIX.
+    """
+    for info, target in jobs:
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd = os.open(target, _EXTRACT_OPEN_FLAGS, 0o644)
+        try:
+            with zf.open(info) as src:
+                while True:
+                    chunk = src.read(_EXTRACT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.write(fd, view)
+                        view = view[written:]
+            if executable_name and hasattr(os, "fchmod") \
+                    and os.path.basename(target) == executable_name:
+                os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
+
+
+def _download_archive(resp, zip_path: str, max_size: int,
+                      expected_sha256: Optional[str] = None) -> None:
+    """Stream a download response to zip_path, verifying it when pinned.
+
+    When a digest is expected it is computed over the same chunks that are
+    written, so verification costs no extra pass over the file; without one
+    the data is not hashed at all.
+
+    Args:
+        resp: Streaming requests response
+        zip_path: Destination file path
+        max_size: Maximum number of bytes to accept
+        expected_sha256: Optional hex digest the download must match
+
+    Raises:
+        RuntimeError: If the download is too large or the digest does not match.
+    """
+    digest = hashlib.sha256() if expected_sha256 else None
+    downloaded_size = 0
+    with open(zip_path, "wb") as fh:
+        for chunk in resp.iter_content(chunk_size=8192):
+            if chunk:
+                downloaded_size += len(chunk)
+                if downloaded_size > max_size:
+                    raise RuntimeError("Downloaded file exceeds maximum size limit")
+                if digest is not None:
+                    digest.update(chunk)
+                fh.write(chunk)
+
+    if digest is not None and digest.hexdigest() != expected_sha256.strip().lower():
+        raise RuntimeError("Downloaded archive failed SHA-256 verification")
+
+
+def _find_extracted_dir(tmp_dir: str) -> Optional[str]:
+    """Locate the top-level platform-tools directory inside tmp_dir.
+
+    Falls back to scanning for any directory named platform-tools*; scandir
+    entries carry their type from readdir, so no per-entry stat is needed.
+    """
+    extracted_dir = os.path.join(tmp_dir, "platform-tools")
+    if os.path.isdir(extracted_dir):
+        return extracted_dir
+    with os.scandir(tmp_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False) and entry.name.lower().startswith("platform-tools"):
+                return entry.path
+    return None
+
+
+def _resolve_installed_adb(install_dir: str, adb_name: str) -> Optional[str]:
+    """Return the resolved path of a regular adb binary inside install_dir.
+
+    The binary is opened once and checked through that descriptor, so the
+    returned path names the same inode that was inspected rather than
+    whatever the path points to after separate exists/isfile probes.
+    """
+    candidate = os.path.join(install_dir, adb_name)
+    try:
+        fd = os.open(candidate, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    try:
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            return None
+        if IS_LINUX:
+            try:
+                return os.readlink(f"/proc/self/fd/{fd}")
+            except OSError:
+                pass
+        return os.path.realpath(candidate)
+    finally:
+        os.close(fd)
+
+
+def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest",
+                                      expected_sha256: Optional[str] = None) -> str:
     """Ensure platform-tools installed in a per-user data dir and return adb path.
 
     Behavior:
@@ -33,7 +180,9 @@ def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest") ->
     - Installs into <data_dir>/platform-tools/<version>/ and creates/update
       a symlink <data_dir>/platform-tools/current -> <version>.
     - Downloads into a temp dir and moves atomically to avoid partial installs.
-    - Sets executable permissions on adb binary.
+    - Sets executable permissions on the adb binary as it is extracted.
+    - If expected_sha256 is given, the download is verified against it while
+      streaming; otherwise the archive is only checked for zip structure.
     - Returns absolute path to adb binary (no PATH modification required).
     """
     try:
@@ -55,20 +204,15 @@ def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest") ->
     target_dir = os.path.join(data_root, target_version)
     current_link = os.path.join(data_root, "current")
 
-    # If current symlink exists and points to a valid adb, return it
-    if os.path.islink(current_link):
-        try:
-            resolved = os.path.realpath(current_link)
-            adb_name = get_adb_binary_name()
-            candidate = os.path.join(resolved, adb_name)
-            if os.path.isfile(candidate):
-                return candidate
-        except Exception:
-            pass
+    adb_name = get_adb_binary_name()
+
+    # If current symlink points to a valid adb, return it
+    installed = _resolve_installed_adb(current_link, adb_name)
+    if installed:
+        return installed
 
     # If requested version already installed, point current there
-    adb_name = get_adb_binary_name()
-    if os.path.isdir(target_dir) and os.path.isfile(os.path.join(target_dir, adb_name)):
+    if _resolve_installed_adb(target_dir, adb_name):
         # update symlink atomically
         if os.path.islink(current_link) or os.path.exists(current_link):
             try:
@@ -82,13 +226,21 @@ def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest") ->
             pass
         return os.path.join(target_dir, adb_name)
 
-    # Download into temp location and extract
-    tmp_dir = tempfile.mkdtemp(prefix="platform-tools-")
+    # Download/extract dependencies are only needed past this point; keep them
+    # off the warm-start path where platform-tools are already installed
+    import requests
+    import shutil
+    import tempfile
+    import zipfile
+
+    # Download into a staging dir beside the install so the final rename stays
+    # on one filesystem and is atomic
+    tmp_dir = tempfile.mkdtemp(prefix=".platform-tools-", dir=data_root)
     try:
         # choose URL
-        if is_linux():
+        if IS_LINUX:
             url = ADB_LINUX_ZIP_URL
-        elif is_windows():
+        elif IS_WINDOWS:
             url = ADB_WIN_ZIP_URL
         else:
             raise RuntimeError("Unsupported platform for platform-tools download")
@@ -107,68 +259,36 @@ def ensure_platform_tools_in_user_dir(version_tag: Optional[str] = "latest") ->
             raise RuntimeError(f"Unexpected content type: {content_type}")
 
         zip_path = os.path.join(tmp_dir, "platform-tools.zip")
-        downloaded_size = 0
         max_size = 200 * 1024 * 1024  # 200MB limit to prevent zip bombs
+        _download_archive(resp, zip_path, max_size, expected_sha256)
 
-        with open(zip_path, "wb") as fh:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    downloaded_size += len(chunk)
-                    if downloaded_size > max_size:
-                        raise RuntimeError("Downloaded file exceeds maximum size limit")
-                    fh.write(chunk)
-
-        # Validate zip file before extraction
-        if not zipfile.is_zipfile(zip_path):
+        # Without a pinned digest fall back to a structural check; a matching
+        # digest already proves the archive is the one we expect
+        if not expected_sha256 and not zipfile.is_zipfile(zip_path):
             raise RuntimeError("Downloaded file is not a valid zip archive")
 
         # extract with safety checks
         with zipfile.ZipFile(zip_path, "r") as zf:
-            # Check for zip bomb (excessive compression ratio)
-            total_size = sum(info.file_size for info in zf.infolist())
-            if total_size > 500 * 1024 * 1024:  # 500MB uncompressed limit
-                raise RuntimeError("Zip archive uncompressed size exceeds safety limit")
-
-            # Check for path traversal in zip entries
-            for info in zf.infolist():
-                # Normalize the path and ensure it doesn't escape tmp_dir
-                # Both paths need to be normalized to use the same separator (important for Windows)
-                normalized = os.path.normpath(os.path.join(tmp_dir, info.filename))
-                tmp_dir_normalized = os.path.normpath(tmp_dir)
-
-                # Ensure tmp_dir has a trailing separator for proper prefix matching
-                tmp_dir_with_sep = tmp_dir_normalized if tmp_dir_normalized.endswith(os.sep) else tmp_dir_normalized + os.sep
-
-                # Check if normalized path is within tmp_dir
-                if not (normalized.startswith(tmp_dir_with_sep) or normalized == tmp_dir_normalized):
-                    raise RuntimeError(f"Zip contains path traversal: {info.filename}")
-
-            zf.extractall(tmp_dir)
+            # One pass over the central directory checks for zip bombs
+            # (500MB uncompressed limit) and path traversal, then extraction
+            # runs from the same plan
+            jobs = _plan_zip_extraction(zf.infolist(), tmp_dir,
+                                        max_total_size=500 * 1024 * 1024)
+            _extract_zip_members(zf, jobs, executable_name=adb_name)
 
         # the zip contains a top-level platform-tools directory; move that into target_dir
-        extracted_dir = os.path.join(tmp_dir, "platform-tools")
-        if not os.path.isdir(extracted_dir):
-            # try to find a platform-tools directory inside temp
-            for entry in os.listdir(tmp_dir):
-                candidate = os.path.join(tmp_dir, entry)
-                if os.path.isdir(candidate) and entry.lower().startswith("platform-tools"):
-                    extracted_dir = candidate
-                    break
-
-        if not os.path.isdir(extracted_dir):
+        extracted_dir = _find_extracted_dir(tmp_dir)
+        if not extracted_dir:
             raise RuntimeError("Platform-tools not found in archive")
 
-        # Atomic install: move extracted_dir -> target_dir (remove existing backup first)
+        # Atomic install: a single rename publishes extracted_dir as target_dir.
+        # An existing target_dir here has no adb binary (see the early return
+        # above), so clearing it first loses nothing if we stop mid-way.
         if os.path.isdir(target_dir):
-            backup = f"{target_dir}.bak"
-            shutil.rmtree(backup, ignore_errors=True)
-            shutil.move(target_dir, backup)
-        shutil.move(extracted_dir, target_dir)
+            shutil.rmtree(target_dir, ignore_errors=True)
+        os.replace(extracted_dir, target_dir)
 
-        # Ensure adb executable perms on POSIX
         adb_path = os.path.join(target_dir, adb_name)
-        if os.path.isfile(adb_path) and os.name == "posix":
-            os.chmod(adb_path, 0o755)
 
         # Atomically update 'current' symlink
         tmp_link = f"{current_link}.tmp"
@@ -237,15 +357,8 @@ def is_adb_available() -> bool:
 def download_and_extract_adb() -> bool:
     """Download and extract ADB tools if not present."""
     try:
+        # Executable permissions are applied during extraction
         adb_path = ensure_platform_tools_in_user_dir()
-        if adb_path and os.path.isfile(adb_path):
-            # Ensure executable permissions on POSIX
-            if os.name == "posix":
-                try:
-                    os.chmod(adb_path, 0o755)
-                except Exception:
-                    pass
-            return True
-        return False
+        return bool(adb_path and os.path.isfile(adb_path))
     except Exception:
         return False
\ No newline at end of file
@@ -3,13 +3,25 @@ Platform-specific utilities for Android File Handler.
 Handles path resolution and platform detection.
 """
 
+import functools
 import os
 import sys
 from typing import Optional
 
+# The platform never changes during a process lifetime, so resolve it once.
+_PLATFORM = sys.platform
+IS_WINDOWS = _PLATFORM == "win32"  # Always "win32" on Windows, 32- or 64-bit
+IS_LINUX = _PLATFORM.startswith("linux")
+IS_MACOS = _PLATFORM == "darwin"
+ADB_BINARY_NAME = "adb.exe" if IS_WINDOWS else "adb"
 
+
+@functools.lru_cache(maxsize=None)
 def get_executable_directory() -> str:
-    """Get the directory containing the executable or script."""
+    """Get the directory containing the executable or script.
+
+    Cached: the location cannot change while the process is running.
+    """
     if getattr(sys, 'frozen', False):
         # Running as executable (PyInstaller, cx_Freeze, etc.)
         return os.path.dirname(sys.executable)
@@ -18,8 +30,12 @@ def get_executable_directory() -> str:
         return os.path.dirname(os.path.abspath(__file__))
 
 
+@functools.lru_cache(maxsize=None)
 def get_platform_tools_directory() -> str:
-    """Get platform-tools directory."""
+    """Get platform-tools directory.
+
+    Cached: resolved once per process, including the src/ existence probe.
+    """
     base_dir = get_executable_directory()
     
     # Check if we're in development mode (running from src/ directory)
@@ -49,27 +65,24 @@ def get_platform_tools_directory() -> str:
 
 def get_platform_type() -> str:
     """Get the current platform type."""
-    return sys.platform
+    return _PLATFORM
 
 
 def get_adb_binary_name() -> str:
     """Get the ADB binary name for current platform."""
-    if sys.platform.startswith("win"):
-        return "adb.exe"
-    else:
-        return "adb"
+    return ADB_BINARY_NAME
 
 
 def is_windows() -> bool:
     """Check if running on Windows."""
-    return sys.platform.startswith("win")
+    return IS_WINDOWS
 
 
 def is_linux() -> bool:
     """Check if running on Linux."""
-    return sys.platform.startswith("linux")
+    return IS_LINUX
 
 
 def is_macos() -> bool:
     """Check if running on macOS."""
-    return sys.platform.startswith("darwin")
\ No newline at end of file
+    return IS_MACOS
@@ -4,12 +4,32 @@ Handles progress callbacks and transfer statistics.
 """
 
 import time
-from typing import Optional, Callable, Dict, Any
+from collections import deque
+from typing import Optional, Callable, Dict, Any, Deque, Tuple
+
+# Minimum interval between byte-mode progress callbacks (20 Hz)
+UI_PUSH_INTERVAL = 0.05
+# Window over which current_speed is averaged, in seconds
+SPEED_WINDOW = 0.5
+# Display units for format_speed, one per power of 1024
+SPEED_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
 
 
 class ProgressTracker:
     """Tracks progress for file transfer operations."""
 
+    __slots__ = (
+        'progress_callback', 'status_callback',
+        'start_time', 'last_update_time', 'total_bytes', 'transferred_bytes',
+        'current_speed', 'estimated_time_remaining',
+        '_speed_samples', '_last_ui_push', '_last_pushed_pct',
+        'current_file', 'total_files', 'files_to_transfer',
+        '_emitted_file', '_emitted_total',
+    )
+
+    # Status-callback prefix for file-count updates parsed by the GUI
+    TRANSFER_PROGRESS_PREFIX = "TRANSFER_PROGRESS:"
+
     def __init__(self) -> None:
         self.progress_callback: Optional[Callable[[int], None]] = None
         self.status_callback: Optional[Callable[[str], None]] = None
@@ -21,11 +41,17 @@ class ProgressTracker:
         self.transferred_bytes: int = 0
         self.current_speed: float = 0.0
         self.estimated_time_remaining: int = 0
-        self.transfer_progress: Dict[str, int] = {
-            'current_file': 0,
-            'total_files': 0,
-            'files_to_transfer': 0
-        }
+        # (monotonic time, transferred bytes) samples for the speed window
+        self._speed_samples: Deque[Tuple[float, int]] = deque()
+        self._last_ui_push: float = 0.0
+        self._last_pushed_pct: int = -1
+        # File-count tracking
+        self.current_file: int = 0
+        self.total_files: int = 0
+        self.files_to_transfer: int = 0
+        # Last file count sent through the status callback
+        self._emitted_file: int = -1
+        self._emitted_total: int = -1
 
     def set_progress_callback(self, callback: Callable[[int], None]) -> None:
         """Set callback function for progress updates."""
@@ -37,30 +63,39 @@ class ProgressTracker:
 
     def start_tracking(self, total_bytes: int) -> None:
         """Start byte-based progress tracking."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.last_update_time = self.start_time
         self.total_bytes = max(0, int(total_bytes))
         self.transferred_bytes = 0
         self.current_speed = 0.0
         self.estimated_time_remaining = 0
+        self._speed_samples = deque([(self.start_time, 0)])
+        self._last_ui_push = 0.0
+        self._last_pushed_pct = -1
 
     def update_progress(self, value: int) -> None:
         """Update progress.
 
         If total_bytes > 0, treat value as bytes transferred so far and update
-        speed and remaining time. Otherwise treat value as percentage and
+        speed and remaining time. Speed is averaged over SPEED_WINDOW and the
+        callback fires only when the whole percentage changes or
+        UI_PUSH_INTERVAL has passed. Otherwise treat value as percentage and
         forward to the callback for UI updates.
         """
         if self.total_bytes > 0:
             new_transferred = max(0, min(int(value), self.total_bytes))
-            now = time.time()
-            elapsed = 0.0
-            if self.last_update_time is not None:
-                elapsed = max(0.0, now - self.last_update_time)
-
-            delta = new_transferred - self.transferred_bytes
-            if elapsed > 0 and delta >= 0:
-                self.current_speed = float(delta) / elapsed
+            now = time.monotonic()
+
+            samples = self._speed_samples
+            samples.append((now, new_transferred))
+            # Keep the newest sample older than the window as the baseline
+            horizon = now - SPEED_WINDOW
+            while len(samples) > 2 and samples[1][0] <= horizon:
+                samples.popleft()
+            base_time, base_bytes = samples[0]
+            elapsed = now - base_time
+            if elapsed > 0 and new_transferred >= base_bytes:
+                self.current_speed = float(new_transferred - base_bytes) / elapsed
 
             self.transferred_bytes = new_transferred
             self.last_update_time = now
@@ -72,7 +107,12 @@ class ProgressTracker:
                 self.estimated_time_remaining = 0
 
             if self.progress_callback:
-                self.progress_callback(int(self.get_progress_percentage()))
+                pct = int(self.get_progress_percentage())
+                if (pct != self._last_pushed_pct
+                        or now - self._last_ui_push >= UI_PUSH_INTERVAL):
+                    self._last_pushed_pct = pct
+                    self._last_ui_push = now
+                    self.progress_callback(pct)
         else:
             if self.progress_callback:
                 self.progress_callback(int(value))
@@ -83,36 +123,55 @@ class ProgressTracker:
             self.status_callback(message)
 
     def update_transfer_progress(self, current_file: int, total_files: int) -> None:
-        """Update transfer progress for file counting."""
-        self.transfer_progress['current_file'] = current_file
-        self.transfer_progress['total_files'] = total_files
+        """Update transfer progress for file counting.
+
+        The status callback receives a TRANSFER_PROGRESS message only when the
+        total changes, the transfer completes, or the count advanced by at
+        least 1% of the total since the last message.
+        """
+        self.current_file = current_file
+        self.total_files = total_files
+        if not self.status_callback:
+            return
+        step = max(1, total_files // 100)
+        if (total_files == self._emitted_total
+                and current_file != total_files
+                and 0 <= current_file - self._emitted_file < step):
+            return
+        self._emitted_file = current_file
+        self._emitted_total = total_files
         # Send progress update through status callback with special format
-        progress_message = f"TRANSFER_PROGRESS:{current_file}:{total_files}"
-        if self.status_callback:
-            self.status_callback(progress_message)
+        self.status_callback(
+            f"{self.TRANSFER_PROGRESS_PREFIX}{current_file}:{total_files}"
+        )
 
     def reset_transfer_progress(self) -> None:
         """Reset transfer progress counters."""
-        self.transfer_progress = {
-            'current_file': 0,
-            'total_files': 0,
-            'files_to_transfer': 0
-        }
+        self.current_file = 0
+        self.total_files = 0
+        self.files_to_transfer = 0
+        self._emitted_file = -1
+        self._emitted_total = -1
 
     def set_files_to_transfer(self, count: int) -> None:
         """Set the total number of files to transfer."""
-        self.transfer_progress['files_to_transfer'] = count
+        self.files_to_transfer = count
+
+    @property
+    def transfer_progress(self) -> Dict[str, int]:
+        """Snapshot of the file-count fields in the legacy dict form."""
+        return {
+            'current_file': self.current_file,
+            'total_files': self.total_files,
+            'files_to_transfer': self.files_to_transfer
+        }
 
     # Utilities expected by tests/UI
     def get_progress_percentage(self) -> float:
-        if self.total_bytes <= 0:
+        total = self.total_bytes
+        if total <= 0:
             return 0.0
-        pct = (self.transferred_bytes / max(1, self.total_bytes)) * 100.0
-        if pct < 0.0:
-            return 0.0
-        if pct > 100.0:
-            return 100.0
-        return float(pct)
+        return min(100.0, max(0.0, self.transferred_bytes * 100.0 / total))
 
     def estimate_time_remaining(self) -> int:
         if self.total_bytes <= 0 or self.transferred_bytes >= self.total_bytes:
@@ -129,71 +188,52 @@ class ProgressTracker:
         self.transferred_bytes = 0
         self.current_speed = 0.0
         self.estimated_time_remaining = 0
+        self._speed_samples.clear()
+        self._last_ui_push = 0.0
+        self._last_pushed_pct = -1
 
     def format_speed(self) -> str:
         bps = float(self.current_speed)
         if bps < 1024:
             return f"{bps:.1f} B/s"
-        kbps = bps / 1024.0
-        if kbps < 1024:
-            return f"{kbps:.1f} KB/s"
-        mbps = kbps / 1024.0
-        return f"{mbps:.1f} MB/s"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit = min((int(bps).bit_length() - 1) // 10, len(SPEED_UNITS) - 1)
+        return f"{bps / (1 << (10 * unit)):.1f} {SPEED_UNITS[unit]}"
 
     def format_time(self, seconds: int) -> str:
-        if seconds < 0:
-            seconds = 0
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
-
-
-class TransferProgressEstimator:
-    """Estimates transfer progress based on various factors."""
-    
-    @staticmethod
-    def estimate_progress_from_time(start_time: float, last_progress: int, 
-                                  elapsed_threshold: float = 1.0, 
-                                  max_increment: int = 20,
-                                  max_progress: int = 90) -> Optional[int]:
-        """Estimate progress based on elapsed time."""
-        current_time = time.time()
-        elapsed_time = current_time - start_time
-        
-        if elapsed_time >= elapsed_threshold and last_progress < max_progress:
-            new_progress = min(last_progress + max_increment, max_progress)
-            return int(new_progress)
-        
-        return None
-    
-    @staticmethod
-    def estimate_progress_from_activity(line_count: int, last_progress: int,
-                                      activity_threshold: int = 50,
-                                      increment: int = 5,
-                                      max_progress: int = 90) -> Optional[int]:
-        """Estimate progress based on output line activity."""
-        if line_count % activity_threshold == 0 and last_progress < max_progress:
-            calculated_increment = max(1, min(increment, max_progress // (line_count // activity_threshold + 1)))
-            new_progress = min(last_progress + calculated_increment, max_progress)
-            return int(new_progress)
-        
+        minutes, secs = divmod(max(0, seconds), 60)
+        if minutes < 60:
+            return f"{minutes:02d}:{secs:02d}"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def estimate_progress(line_count: int, elapsed: float, last_progress: int,
+                      complex_estimate: bool = False) -> Optional[int]:
+    """Estimate transfer progress when adb output carries no percentage.
+
+    Works purely on the caller's counters, so the per-line hot loop makes a
+    single call with no clock reads or class attribute lookups.
+
+    Args:
+        line_count: Output lines seen so far
+        elapsed: Seconds since the transfer started
+        last_progress: Last reported percentage
+        complex_estimate: Blend output activity and elapsed time for large
+            transfers (capped at 95) instead of stepping by 20 (capped at 90)
+
+    Returns:
+        New percentage, or None if progress should not advance yet
+    """
+    if complex_estimate:
+        if elapsed < 2.0 or last_progress >= 95:
+            return None
+        if line_count > 100:
+            activity_factor = min(line_count / 1000, 50)
+            time_factor = min(elapsed / 60, 40)
+            return int(min(activity_factor + time_factor, 95))
+        return min(last_progress + 10, 95)
+
+    if elapsed < 1.0 or last_progress >= 90:
         return None
-    
-    @staticmethod
-    def estimate_complex_progress(line_count: int, elapsed_time: float, 
-                                last_progress: int) -> Optional[int]:
-        """Estimate progress using complex algorithm for large transfers."""
-        if elapsed_time >= 2.0 and last_progress < 95:
-            if line_count > 100:
-                activity_factor = min(line_count / 1000, 50)
-                time_factor = min(elapsed_time / 60, 40)
-                new_progress = min(activity_factor + time_factor, 95)
-            else:
-                new_progress = min(last_progress + 10, 95)
-            
-            return int(new_progress)
-        
-        return None
\ No newline at end of file
+    return min(last_progress + 20, 90)
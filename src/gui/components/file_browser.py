@@ -3,19 +3,194 @@ Windows Android Browser Module
 Provides Android filesystem browsing capabilities for Windows and Linux using ADB.
 """
 
+import concurrent.futures
+import contextlib
+import logging
+import queue
+import shlex
 import threading
+import time
 import tkinter as tk
-from tkinter import messagebox, ttk
+from collections import OrderedDict
+from tkinter import messagebox
+
+
+logger = logging.getLogger(__name__)
+
+# Directory listings kept per browser (LRU), keyed by (device, path)
+_DIR_CACHE_SIZE = 500
+# Seconds a cached listing is served before the device is asked again
+_LISTING_CACHE_TTL = 30.0
+# Folders waiting to be prefetched; extra requests are dropped when full
+_PREFETCH_QUEUE_SIZE = 64
+# Prefetch workers, each with its own adb shell so sibling folders are
+# listed concurrently rather than queued behind one session
+_PREFETCH_WORKERS = 3
+# Levels below the Android root listed by the single background tree dump;
+# two levels cover the root's own folders, which are not prefetched separately
+_TREE_DUMP_DEPTH = 2
+# Most output lines the tree dump may return; a larger tree is not cached
+# and its folders are listed one by one as they are expanded
+_TREE_DUMP_MAX_LINES = 5000
+# Separates the folder and file sections of the tree dump output
+_TREE_DUMP_FILES_MARKER = "__FILES__"
+# Worker threads hand tree updates to the UI thread through a queue polled
+# at this interval; at most _UI_BATCH_SIZE updates are applied per poll
+_UI_POLL_INTERVAL_MS = 16
+_UI_BATCH_SIZE = 50
+# Rows added per poll when filling a large folder, so the first rows show
+# without waiting for the whole listing to be inserted
+_ROW_BATCH_SIZE = 200
+
+
+def _parse_listing(stdout):
+    """Split ``ls -1p`` output into visible folder and file names.
+
+    Args:
+        stdout: One entry per line, directories suffixed with "/"
+
+    Returns:
+        Tuple of sorted (folders, files), hidden entries skipped
+    """
+    # Comprehensions keep the per-entry loop in C for large listings
+    names = [name for name in stdout.splitlines() if name and name[0] != "."]
+    folders = [name[:-1] for name in names if name[-1] == "/"]
+    files = [name for name in names if name[-1] != "/"]
+    # Sorted in place, so callers can insert without copying the lists
+    folders.sort()
+    files.sort()
+    return folders, files
+
+
+def _group_tree_dump(root, stdout, depth):
+    """Split a ``find .`` tree dump of root into per-folder listings.
+
+    Args:
+        root: Folder the dump was taken from
+        stdout: Relative folder paths, the files marker, then relative file
+            paths; "find: '<path>': ..." error lines mark unreadable folders
+        depth: -maxdepth the dump was taken with
+
+    Returns:
+        Dict mapping each completely listed folder to ``ls -1p`` style output
+    """
+    dirs_part, marker, files_part = stdout.partition(_TREE_DUMP_FILES_MARKER)
+    if not marker:
+        return {}
+    root = root.rstrip("/")
+    listings = {".": []}
+    unreadable = set()
+    for line in dirs_part.splitlines():
+        if line.startswith("find: "):
+            start, end = line.find("'"), line.rfind("'")
+            if start < end:
+                unreadable.add(line[start + 1:end].rstrip("/"))
+            continue
+        if not line.startswith("./"):
+            continue
+        parent, _, name = line.rpartition("/")
+        listings.setdefault(parent, []).append(name + "/")
+        # Folders at the last level were entered but their contents not dumped
+        if line.count("/") < depth:
+            listings.setdefault(line, [])
+    for line in files_part.splitlines():
+        if line.startswith("./"):
+            parent, _, name = line.rpartition("/")
+            listings.setdefault(parent, []).append(name)
+
+    return {
+        root + path[1:]: "\n".join(sorted(names))
+        for path, names in listings.items()
+        if path not in unreadable
+    }
+
+
+def _close_sessions(sessions, on_closed=None):
+    """Close adb shell sessions on a daemon thread so the caller never waits.
+
+    Args:
+        sessions: PersistentAdbShell instances to close
+        on_closed: Optional callable run once every session is closed
+    """
+    def close_all():
+        for session in sessions:
+            session.close()
+        if on_closed is not None:
+            on_closed()
+
+    threading.Thread(target=close_all, daemon=True).start()
 
 
 class AndroidFileBrowser:
     """Android filesystem browser for Windows using ADB."""
 
-    def __init__(self, parent_window, adb_manager, path_callback=None):
+    def __init__(self, parent_window, adb_manager, path_callback=None, device_check=None):
         self.parent = parent_window
         self.adb_manager = adb_manager
         self.path_callback = path_callback
+        # Callable returning the connected device; may serve a recent cached result
+        self.device_check = device_check or adb_manager.check_device
+        # Listings survive between browser windows for _LISTING_CACHE_TTL seconds
+        self._listing_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Row icons, drawn on first use; kept here so Tk does not lose them
+        self._icons = None
+
+    def clear_cache(self):
+        """Forget all cached directory listings, e.g. after the device changed."""
+        with self._cache_lock:
+            self._listing_cache.clear()
+
+    def _get_cached_listing(self, key):
+        """Return a fresh cached listing.
 
+        Args:
+            key: (device, path) the listing was stored under
+
+        Returns:
+            (stdout, stderr, returncode) tuple, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._listing_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= _LISTING_CACHE_TTL:
+                del self._listing_cache[key]
+                return None
+            self._listing_cache.move_to_end(key)
+            return result
+
+    def _store_listing(self, key, result):
+        """Cache a successful listing, evicting the least recently used.
+
+        Args:
+            key: (device, path) of the listed directory
+            result: (stdout, stderr, returncode) tuple from the shell
+        """
+        if result[0] is None or result[2] != 0:
+            return
+        with self._cache_lock:
+            self._listing_cache[key] = (time.monotonic(), result)
+            self._listing_cache.move_to_end(key)
+            while len(self._listing_cache) > _DIR_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+
+    def _get_icons(self):
+        """Return the folder and file row icons, drawing them on first use.
+
+        Returns:
+            Dict mapping "folder" and "file" to 16x16 PhotoImages
+        """
+        if self._icons is None:
+            folder = tk.PhotoImage(master=self.parent, width=16, height=16)
+            folder.put("#d9a400", to=(1, 2, 7, 4))
+            folder.put("#f4c430", to=(1, 4, 15, 14))
+            file = tk.PhotoImage(master=self.parent, width=16, height=16)
+            file.put("#808080", to=(3, 1, 13, 15))
+            file.put("#ffffff", to=(4, 2, 12, 14))
+            self._icons = {"folder": folder, "file": file}
+        return self._icons
 
     def show_browser(self, direction="pull"):
         """Show a browsable Android folder tree. 
@@ -23,8 +198,11 @@ class AndroidFileBrowser:
         Args:
             direction: "pull" to show files and folders, "push" to show folders only
         """
+        # ttk is only needed once a browser window is actually opened
+        from tkinter import ttk
+
         # Check if device is connected
-        device = self.adb_manager.check_device()
+        device = self.device_check()
         if not device:
             messagebox.showerror(
                 "No Device",
@@ -45,6 +223,109 @@ class AndroidFileBrowser:
         browser_window.transient(self.parent)
         browser_window.grab_set()
 
+        # One adb shell serves every listing in this window instead of
+        # starting a new adb process per expanded folder
+        shell = self.adb_manager.open_shell()
+        # Folder expansions reuse pooled threads instead of one thread each
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="adb-ls"
+        )
+
+        def on_browser_destroy(event):
+            if event.widget is browser_window:
+                browser_window.after_cancel(ui_poll_id[0])
+                executor.shutdown(wait=False, cancel_futures=True)
+                # Busy sessions must not hold up the Tk thread while they close
+                _close_sessions([shell, *prefetch_shells], wake_prefetch_workers)
+
+        def wake_prefetch_workers():
+            """Wake the prefetch workers so they see their closed sessions."""
+            for _ in prefetch_shells:
+                try:
+                    prefetch_queue.put_nowait("")
+                except queue.Full:
+                    break
+
+        browser_window.bind("<Destroy>", on_browser_destroy)
+
+        # Listings of child folders are fetched one level ahead in the
+        # background so expanding them later needs no adb round trip
+        prefetch_queue = queue.Queue(maxsize=_PREFETCH_QUEUE_SIZE)
+
+        # Sessions are started lazily by their first command
+        prefetch_shells = [
+            self.adb_manager.open_shell() for _ in range(_PREFETCH_WORKERS)
+        ]
+
+        def list_directory(path, session=shell):
+            """Return the (stdout, stderr, returncode) ls -1p listing of path."""
+            # Ensure path ends with / for proper directory listing
+            list_path = path if path.endswith("/") else path + "/"
+            result = session.run(f"ls -1p {shlex.quote(list_path)}")
+            self._store_listing((device, path), result)
+            return result
+
+        def bulk_list(root, session):
+            """Cache every listing within _TREE_DUMP_DEPTH levels of root in one command."""
+            find = f"find . -mindepth 1 -maxdepth {_TREE_DUMP_DEPTH}"
+            stdout, _, _ = session.run(
+                f"cd {shlex.quote(root)} && {{ {find} -type d 2>&1;"
+                f" echo {_TREE_DUMP_FILES_MARKER}; {find} ! -type d 2>/dev/null; }}"
+                f" | head -n {_TREE_DUMP_MAX_LINES + 1}"
+            )
+            # A cut-off dump would cache incomplete listings
+            if stdout is None or stdout.count("\n") >= _TREE_DUMP_MAX_LINES:
+                return
+            listings = _group_tree_dump(root, stdout, _TREE_DUMP_DEPTH)
+            # Deepest first, so the LRU keeps the shallow folders if it overflows
+            for path in sorted(listings, key=lambda p: p.count("/"), reverse=True):
+                self._store_listing((device, path), (listings[path], "", 0))
+
+        def prefetch_worker(session):
+            """Cache listings from prefetch_queue until session is closed."""
+            while not session.closed:
+                path = prefetch_queue.get()
+                if not path or self._get_cached_listing((device, path)) is not None:
+                    continue
+                list_directory(path, session)
+
+        def prefetch(paths):
+            """Queue folder paths for background listing."""
+            for path in paths:
+                try:
+                    prefetch_queue.put_nowait(path)
+                except queue.Full:
+                    break
+
+        def take_cached_listing(path):
+            """Return a cached listing for path, or None if not cached."""
+            return self._get_cached_listing((device, path))
+
+        for session in prefetch_shells:
+            threading.Thread(
+                target=prefetch_worker, args=(session,), daemon=True
+            ).start()
+
+        # Tree updates from worker threads are queued and applied by a single
+        # recurring poller instead of scheduling one Tk timer per update
+        ui_queue = queue.SimpleQueue()
+        ui_poll_id = [None]
+
+        def drain_ui_queue():
+            """Apply queued tree updates on the UI thread, then reschedule."""
+            try:
+                # Updates queued while draining wait for the next poll
+                for _ in range(min(_UI_BATCH_SIZE, ui_queue.qsize())):
+                    try:
+                        update = ui_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    update()
+            finally:
+                ui_poll_id[0] = browser_window.after(_UI_POLL_INTERVAL_MS, drain_ui_queue)
+
+        ui_poll_id[0] = browser_window.after(_UI_POLL_INTERVAL_MS, drain_ui_queue)
+
         tk.Label(
             browser_window,
             text=label_text,
@@ -82,28 +363,93 @@ class AndroidFileBrowser:
         )
         current_path_label.pack(side="left", padx=(5, 0))
 
+        @contextlib.contextmanager
+        def detached(item):
+            """Detach item while its children are rebuilt so the tree lays out once.
+
+            Args:
+                item: Tree item whose children are about to change
+            """
+            parent = tree.parent(item)
+            index = tree.index(item)
+            selection = tree.selection()
+            tree.detach(item)
+            try:
+                yield
+            finally:
+                tree.move(item, parent, index)
+                # Keep the user's selection if detaching dropped it
+                if selection and tree.selection() != selection:
+                    tree.selection_set(selection)
+
+        # Rows show bitmap icons rather than emoji prefixes in their text
+        icons = self._get_icons()
+
+        # Placeholder rows by item id, so finding them needs no Tk round trip
+        placeholders = {}
+        # Folders whose children have not been requested yet
+        pending_loads = set()
+
+        def insert_placeholder(parent_item, text):
+            """Insert a status row such as "Loading..." under parent_item."""
+            item = tree.insert(parent_item, "end", text=text, values=[""])
+            placeholders[item] = text
+            if text == "Loading...":
+                pending_loads.add(parent_item)
+            return item
+
+        def remove_placeholders(parent_item, text=None):
+            """Delete parent_item's placeholder rows, or only those showing text."""
+            stale = [
+                child
+                for child in tree.get_children(parent_item)
+                if child in placeholders and text in (None, placeholders[child])
+            ]
+            for child in stale:
+                del placeholders[child]
+            if text in (None, "Loading..."):
+                pending_loads.discard(parent_item)
+            if stale:
+                tree.delete(*stale)
+
+        def insert_rows(parent_item, rows, start=0):
+            """Insert (text, values) rows, one batch per UI poll for large folders.
+
+            The first batch is inserted by the caller's detached rebuild;
+            later batches detach parent_item themselves.
+
+            Args:
+                parent_item: Tree item the rows belong under
+                rows: Row texts and values, folders marked by a "folder" value
+                start: Index of the first row not inserted yet
+            """
+            end = start + _ROW_BATCH_SIZE
+            for text, values in rows[start:end]:
+                item = tree.insert(
+                    parent_item, "end", text=text, image=icons[values[1]], values=values
+                )
+                if values[1] == "folder":
+                    # Add a dummy child to make it expandable
+                    insert_placeholder(item, "Loading...")
+            if end < len(rows):
+                def insert_next_batch():
+                    # Each later batch also lays the folder out only once
+                    with detached(parent_item):
+                        insert_rows(parent_item, rows, end)
+
+                ui_queue.put(insert_next_batch)
+
         def load_folders_async(parent_item, path):
             """Load folders asynchronously to avoid UI freezing."""
 
-            def load_in_thread():
+            def load_in_thread(result=None):
                 try:
-                    # Ensure path ends with / for proper directory listing
-                    list_path = path if path.endswith("/") else path + "/"
-
-                    # Use ls -la to get detailed listing with file type information
-                    result = self.adb_manager.run_adb_command(
-                        ["shell", "ls", "-la", list_path]
-                    )
+                    if result is None:
+                        result = list_directory(path)
 
                     if not isinstance(result, tuple) or len(result) != 3:
-                        self.parent.after(
-                            0,
-                            lambda: tree.insert(
-                                parent_item,
-                                "end",
-                                text="(Error loading folders)",
-                                values=[""],
-                            ),
+                        ui_queue.put(
+                            lambda: insert_placeholder(parent_item, "(Error loading folders)")
                         )
                         return
 
@@ -111,271 +457,134 @@ class AndroidFileBrowser:
 
                     # Update UI in main thread - always remove Loading... first
                     def update_tree():
-                        # First, remove any existing dummy children
-                        children = tree.get_children(parent_item)
-                        for child in children:
-                            child_text = tree.item(child, "text")
-                            if child_text in [
-                                "Loading...",
-                                "(No Folders)",
-                                "(Error loading folders)",
-                                "(Permission denied)",
-                            ]:
-                                tree.delete(child)
-
-                        # Check for errors
-                        if returncode != 0:
-                            if stderr and "Permission denied" in stderr:
-                                tree.insert(
-                                    parent_item,
-                                    "end",
-                                    text="(Permission denied)",
-                                    values=[""],
-                                )
-                            else:
-                                tree.insert(
-                                    parent_item,
-                                    "end",
-                                    text="(Error loading folders)",
-                                    values=[""],
-                                )
-                            return
+                        # Rebuild the children while the folder is detached
+                        with detached(parent_item):
+                            # First, remove any existing dummy children
+                            remove_placeholders(parent_item)
+
+                            # Check for errors
+                            if returncode != 0:
+                                if stderr and "Permission denied" in stderr:
+                                    insert_placeholder(parent_item, "(Permission denied)")
+                                else:
+                                    insert_placeholder(parent_item, "(Error loading folders)")
+                                return
+
+                            if not stdout or not stdout.strip():
+                                insert_placeholder(parent_item, "(No Folders)")
+                                return
+
+                            # ls -1p marks directories with a trailing slash
+                            folders, files = _parse_listing(stdout)
+                            # Child paths are plain joins onto the listed directory
+                            base_path = path.rstrip("/")
+
+                            # Folders first, then files - only if not in push mode
+                            folder_paths = [f"{base_path}/{folder}" for folder in folders]
+                            rows = [
+                                (folder, [folder_path, "folder"])
+                                for folder, folder_path in zip(folders, folder_paths)
+                            ]
+                            if direction != "push":
+                                rows += [
+                                    (file, [f"{base_path}/{file}", "file"])
+                                    for file in files
+                                ]
+                            insert_rows(parent_item, rows)
+                            prefetch(folder_paths)
+
+                            # If no folders or files found, show indicator
+                            if not folders and (not files or direction == "push"):
+                                empty_text = "(No Folders)" if direction == "push" else "(Empty Directory)"
+                                insert_placeholder(parent_item, empty_text)
+
+                    if cached is not None:
+                        update_tree()
+                    else:
+                        ui_queue.put(update_tree)
 
-                        if not stdout or not stdout.strip():
-                            tree.insert(
-                                parent_item, "end", text="(No Folders)", values=[""]
-                            )
-                            return
+                except Exception:
+                    logger.exception("Error loading folders from %s", path)
 
-                        # Parse ls -la output to find directories and files
-                        folders = []
-                        files = []
-                        lines = stdout.strip().split("\n")
-                        for line in lines:
-                            if line.startswith("d"):
-                                # Directory entry
-                                parts = line.split()
-                                if len(parts) >= 8:
-                                    # Method 1: Use regex to find time pattern and extract name after it
-                                    import re
-
-                                    time_pattern = r"\d{1,2}:\d{2}"
-                                    time_matches = list(re.finditer(time_pattern, line))
-
-                                    if time_matches:
-                                        # Take everything after the last time pattern
-                                        last_time_match = time_matches[-1]
-                                        folder_name = line[
-                                            last_time_match.end() :
-                                        ].strip()
-                                    else:
-                                        # Fallback: join from part 8 (skip date/time fields)
-                                        folder_name = (
-                                            " ".join(parts[8:])
-                                            if len(parts) > 8
-                                            else parts[7]
-                                        )
-
-                                    # Additional validation and cleanup
-                                    folder_name = folder_name.strip()
-
-                                    if (
-                                        folder_name
-                                        and folder_name not in [".", ".."]
-                                        and not folder_name.startswith(".")
-                                    ):
-                                        folders.append(folder_name)
-                            elif line.startswith("-") and direction != "push":
-                                # Regular file entry - only show files if not in push mode
-                                parts = line.split()
-                                if len(parts) >= 8:
-                                    # Extract file name using same method as folders
-                                    import re
-
-                                    time_pattern = r"\d{1,2}:\d{2}"
-                                    time_matches = list(re.finditer(time_pattern, line))
-
-                                    if time_matches:
-                                        # Take everything after the last time pattern
-                                        last_time_match = time_matches[-1]
-                                        file_name = line[
-                                            last_time_match.end() :
-                                        ].strip()
-                                    else:
-                                        # Fallback: join from part 8 (skip date/time fields)
-                                        file_name = (
-                                            " ".join(parts[8:])
-                                            if len(parts) > 8
-                                            else parts[7]
-                                        )
-
-                                    # Additional validation and cleanup
-                                    file_name = file_name.strip()
-
-                                    if (
-                                        file_name
-                                        and not file_name.startswith(".")
-                                    ):
-                                        files.append(file_name)
-
-                        # Add folders to tree first (sorted)
-                        if folders:
-                            for folder in sorted(folders):
-                                folder_path = f"{path.rstrip('/')}/{folder}"
-                                item = tree.insert(
-                                    parent_item,
-                                    "end",
-                                    text=f"📁 {folder}",
-                                    values=[folder_path, "folder"],
-                                )
-                                # Add a dummy child to make it expandable
-                                tree.insert(item, "end", text="Loading...")
-                        
-                        # Add files to tree (sorted) - only if not in push mode
-                        if files and direction != "push":
-                            for file in sorted(files):
-                                file_path = f"{path.rstrip('/')}/{file}"
-                                tree.insert(
-                                    parent_item,
-                                    "end",
-                                    text=f"📄 {file}",
-                                    values=[file_path, "file"],
-                                )
-                        
-                        # If no folders or files found, show indicator
-                        if not folders and (not files or direction == "push"):
-                            empty_text = "(No Folders)" if direction == "push" else "(Empty Directory)"
-                            tree.insert(
-                                parent_item, "end", text=empty_text, values=["", ""]
-                            )
+                    def error_update():
+                        # Remove Loading... even on error
+                        remove_placeholders(parent_item, "Loading...")
+                        insert_placeholder(parent_item, "(Error loading folders)")
 
-                    self.parent.after(0, update_tree)
+                    ui_queue.put(error_update)
 
-                except Exception as e:
-                    print(f"Error loading folders from {path}: {e}")
+            # A prefetched listing is applied right away on the UI thread
+            cached = take_cached_listing(path)
+            if cached is not None:
+                load_in_thread(cached)
+                return
 
-                    def error_update():
-                        # Remove Loading... even on error
-                        children = tree.get_children(parent_item)
-                        for child in children:
-                            child_text = tree.item(child, "text")
-                            if child_text == "Loading...":
-                                tree.delete(child)
-                        tree.insert(
-                            parent_item,
-                            "end",
-                            text="(Error loading folders)",
-                            values=[""],
-                        )
+            # Run in a pooled background thread
+            executor.submit(load_in_thread)
 
-                    self.parent.after(0, error_update)
-
-            # Run in background thread
-            threading.Thread(target=load_in_thread, daemon=True).start()
-
-        def load_folders(parent_item, path):
-            """Load folders from Android device using ADB (legacy sync version for initial load)."""
-            # First, remove any existing dummy children
-            children = tree.get_children(parent_item)
-            for child in children:
-                child_text = tree.item(child, "text")
-                if child_text in [
-                    "Loading...",
-                    "(No Folders)",
-                    "(Error loading folders)",
-                    "(Permission denied)",
-                ]:
-                    tree.delete(child)
+        def load_folders(parent_item, path, result=None):
+            """Load folders from Android device using ADB (legacy sync version for initial load).
 
-            try:
-                # Ensure path ends with / for proper directory listing
-                list_path = path if path.endswith("/") else path + "/"
+            Args:
+                parent_item: Tree item to populate
+                path: Android directory path
+                result: Already captured (stdout, stderr, returncode) listing of
+                    path; fetched through the shell session when omitted
+            """
+            # Rebuild the children while the folder is detached
+            with detached(parent_item):
+                # First, remove any existing dummy children
+                remove_placeholders(parent_item)
 
-                # Use ls -la to get detailed listing with file type information
-                result = self.adb_manager.run_adb_command(
-                    ["shell", "ls", "-la", list_path]
-                )
+                try:
+                    if result is None:
+                        result = list_directory(path)
 
-                if not isinstance(result, tuple) or len(result) != 3:
-                    tree.insert(
-                        parent_item, "end", text="(Error loading folders)", values=[""]
-                    )
-                    return []
+                    if not isinstance(result, tuple) or len(result) != 3:
+                        insert_placeholder(parent_item, "(Error loading folders)")
+                        return []
 
-                stdout, stderr, returncode = result
-                if returncode != 0:
-                    if stderr and "Permission denied" in stderr:
-                        tree.insert(
-                            parent_item, "end", text="(Permission denied)", values=[""]
-                        )
+                    stdout, stderr, returncode = result
+                    if returncode != 0:
+                        if stderr and "Permission denied" in stderr:
+                            insert_placeholder(parent_item, "(Permission denied)")
+                        else:
+                            insert_placeholder(parent_item, "(Error loading folders)")
+                        return []
+
+                    if not stdout or not stdout.strip():
+                        insert_placeholder(parent_item, "(No Folders)")
+                        return []
+
+                    # ls -1p marks directories with a trailing slash
+                    folders, _ = _parse_listing(stdout)
+                    base_path = path.rstrip("/")
+
+                    # Add folders to tree
+                    # Their listings come from the background tree dump, so
+                    # they are not queued for prefetching as well
+                    if folders:
+                        for folder in folders:
+                            folder_path = f"{base_path}/{folder}"
+                            item = tree.insert(
+                                parent_item,
+                                "end",
+                                text=folder,
+                                image=icons["folder"],
+                                values=[folder_path],
+                            )
+                            # Add a dummy child to make it expandable
+                            insert_placeholder(item, "Loading...")
                     else:
-                        tree.insert(
-                            parent_item,
-                            "end",
-                            text="(Error loading folders)",
-                            values=[""],
-                        )
-                    return []
+                        # No folders found, show indicator
+                        insert_placeholder(parent_item, "(No Folders)")
 
-                if not stdout or not stdout.strip():
-                    tree.insert(parent_item, "end", text="(No Folders)", values=[""])
+                    return folders
+                except Exception:
+                    logger.exception("Error loading folders from %s", path)
+                    insert_placeholder(parent_item, "(Error loading folders)")
                     return []
 
-                # Parse ls -la output to find directories
-                folders = []
-                lines = stdout.strip().split("\n")
-                for line in lines:
-                    if line.startswith("d"):
-                        # Extract folder name - improved parsing to prevent truncation
-                        parts = line.split()
-                        if len(parts) >= 8:
-                            # Method 1: Use regex to find time pattern and extract name after it
-                            import re
-
-                            time_pattern = r"\d{1,2}:\d{2}"
-                            time_matches = list(re.finditer(time_pattern, line))
-
-                            if time_matches:
-                                # Take everything after the last time pattern
-                                last_time_match = time_matches[-1]
-                                folder_name = line[last_time_match.end() :].strip()
-                            else:
-                                # Fallback: join from part 8 (skip date/time fields)
-                                folder_name = (
-                                    " ".join(parts[8:]) if len(parts) > 8 else parts[7]
-                                )
-
-                            # Additional validation and cleanup
-                            folder_name = folder_name.strip()
-
-                            if (
-                                folder_name
-                                and folder_name not in [".", ".."]
-                                and not folder_name.startswith(".")
-                            ):
-                                folders.append(folder_name)
-
-                # Add folders to tree
-                if folders:
-                    for folder in sorted(folders):
-                        folder_path = f"{path.rstrip('/')}/{folder}"
-                        item = tree.insert(
-                            parent_item, "end", text=folder, values=[folder_path]
-                        )
-                        # Add a dummy child to make it expandable
-                        tree.insert(item, "end", text="Loading...")
-                else:
-                    # No folders found, show indicator
-                    tree.insert(parent_item, "end", text="(No Folders)", values=[""])
-
-                return folders
-            except Exception as e:
-                print(f"Error loading folders from {path}: {e}")
-                tree.insert(
-                    parent_item, "end", text="(Error loading folders)", values=[""]
-                )
-                return []
-
         def on_tree_expand(event):
             """Handle tree expansion - load subfolders dynamically."""
             item = tree.selection()[0] if tree.selection() else tree.focus()
@@ -391,14 +600,10 @@ class AndroidFileBrowser:
 
             current_path_var.set(folder_path)
 
-            # Check if we need to load subfolders
-            children = tree.get_children(item)
-            has_loading = any(
-                tree.item(child, "text") == "Loading..." for child in children
-            )
-
-            # Only load if we have a "Loading..." placeholder - use async version
-            if has_loading:
+            # Only load folders still showing "Loading..." - use async version.
+            # Claiming the item first keeps a quick re-expand from loading twice
+            if item in pending_loads:
+                pending_loads.discard(item)
                 load_folders_async(item, folder_path)
 
         def on_tree_select(event):
@@ -415,35 +620,40 @@ class AndroidFileBrowser:
         tree.bind("<<TreeviewOpen>>", on_tree_expand)
         tree.bind("<<TreeviewSelect>>", on_tree_select)
 
-        # Determine which path to use - prefer /sdcard, fallback to /storage/emulated/0
+        # Determine which path to use - prefer /sdcard, fallback to /storage/emulated/0.
+        # One command both probes /sdcard and lists whichever root is usable.
         primary_path = "/sdcard"
         fallback_path = "/storage/emulated/0"
+        sdcard_ok = "__SDCARD_OK__"
 
-        # Test if /sdcard is accessible (with trailing slash for directory listing)
-        test_result = self.adb_manager.run_adb_command(
-            ["shell", "ls", "-la", primary_path + "/"]
+        root_result = shell.run(
+            f"ls -1p {primary_path}/ 2>/dev/null && echo {sdcard_ok}"
+            f" || ls -1p {fallback_path}/"
         )
-        if (
-            isinstance(test_result, tuple)
-            and len(test_result) == 3
-            and test_result[2] == 0
-        ):
+        stdout, stderr, returncode = root_result
+        if stdout and stdout.rstrip().endswith(sdcard_ok):
             # /sdcard is accessible
             android_path = primary_path
+            stdout = stdout.rstrip()[: -len(sdcard_ok)]
+            root_result = (stdout, stderr, returncode)
         else:
             # /sdcard not accessible, use fallback
             android_path = fallback_path
 
         # Create single "Android" root item
         android_item = tree.insert("", "end", text="Android", values=[android_path])
-        tree.insert(android_item, "end", text="Loading...")
+        insert_placeholder(android_item, "Loading...")
 
         # Set initial path
         current_path_var.set(android_path)
 
+        # Dump the root's folders in the background, so expanding them finds
+        # their listing cached instead of asking the device
+        executor.submit(bulk_list, android_path, prefetch_shells[0])
+
         # Expand and load the Android root immediately
         tree.item(android_item, open=True)
-        load_folders(android_item, android_path)
+        load_folders(android_item, android_path, root_result)
 
         # Select the Android item
         tree.selection_set(android_item)
@@ -13,6 +13,9 @@ except ImportError:
     from gui.dialogs.license_agreement import LicenseAgreementFrame, check_license_agreement
 
 
+PATH_PLACEHOLDER = "Please select file or folder ->"
+
+
 class PathSelectorFrame:
     """Frame component for path selection with browse button."""
     
@@ -32,7 +35,7 @@ class PathSelectorFrame:
         path_frame = tk.Frame(self.frame)
         path_frame.pack(fill="x", pady=(0, 10))
         
-        self.path_var = tk.StringVar(value="Please select file or folder ->")
+        self.path_var = tk.StringVar(value=PATH_PLACEHOLDER)
         self.path_display = tk.Label(
             path_frame, 
             textvariable=self.path_var, 
@@ -71,18 +74,22 @@ class PathSelectorFrame:
         """
         return self.path_var.get().strip()
     
-    def is_path_selected(self) -> bool:
+    def is_path_selected(self, path: Optional[str] = None) -> bool:
         """Check if a valid path is selected.
         
+        Args:
+            path: Value already read with get_path(); read from the widget if omitted
+
         Returns:
             True if path is selected and not the default placeholder
         """
-        path = self.get_path()
-        return path and path != "Please select file or folder ->"
+        if path is None:
+            path = self.get_path()
+        return bool(path) and path != PATH_PLACEHOLDER
     
     def clear_path(self) -> None:
         """Clear the path selection."""
-        self.path_var.set("Please select file or folder ->")
+        self.path_var.set(PATH_PLACEHOLDER)
     
     def enable_browse(self) -> None:
         """Enable the browse button."""
@@ -143,9 +150,12 @@ class StatusLabel:
             parent: Parent widget
             initial_text: Initial status text
         """
+        # The label follows this variable, so updates only set it and Tk
+        # redraws on its next idle cycle
+        self.text_var = tk.StringVar(value=initial_text)
         self.label = tk.Label(
             parent,
-            text=initial_text,
+            textvariable=self.text_var,
             wraplength=0,  # Will be set dynamically
             justify="center",
             anchor="center"
@@ -161,7 +171,7 @@ class StatusLabel:
         Args:
             text: Text to display
         """
-        self.label.config(text=text)
+        self.text_var.set(text)
     
     def get_text(self) -> str:
         """Get the current status text.
@@ -169,7 +179,7 @@ class StatusLabel:
         Returns:
             Current status text
         """
-        return self.label.cget("text")
+        return self.text_var.get()
     
     def _on_window_configure(self, event) -> None:
         """Handle window resize events to update label wrapping.
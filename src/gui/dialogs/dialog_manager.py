@@ -4,9 +4,60 @@ Handles various dialog boxes and message windows for the application.
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, scrolledtext
+from tkinter import messagebox
 import os
-from typing import Optional, Tuple
+from typing import Callable, Optional
+
+
+# Delay before re-wrapping dialog text after the last resize event
+WRAP_DEBOUNCE_MS = 50
+
+# Fonts shared by every dialog, defined once instead of per widget
+_DIALOG_FONT = ("Arial", 10)
+_CHOICE_PROMPT_FONT = ("Arial", 11)
+_STATS_TITLE_FONT = ("Arial", 14, "bold")
+_STATS_FONT = ("Courier", 10)
+# Named ttk style for the statistics body, configured on first use
+_STATS_LABEL_STYLE = "Stats.TLabel"
+
+# Shown when no device is detected; kept at module level so it is built once
+_TROUBLESHOOTING_STEPS = (
+    "Android device appears to have been disconnected and/or USB debugging is disabled.\n"
+    "Please ensure your Android device is securely connected at both ends.\n\n"
+
+    "To enable USB debugging:\n"
+    "1. Connect your device to the computer via USB\n"
+    "2. Open Settings → About phone\n"
+    "3. Tap 'Build number' seven times to unlock Developer Options\n"
+    "   (You only need to do this once unless you disable it, reset settings, or wipe your device)\n"
+    "4. Navigate back and go to System → Developer Options\n"
+    "5. Find and enable 'USB debugging'\n"
+    "   (Tip: Use the search icon at the top if you can't find it)\n"
+    "6. Connect via USB and tap 'Trust' when prompted\n"
+    "   (Checking 'Remember' is recommended for future transfers)\n\n"
+
+    "Ensure File Transfer mode is enabled:\n"
+    "1. After connecting, swipe down to view notifications\n"
+    "2. Look for a USB notification (often shows 'Charging over USB')\n"
+    "3. Tap the notification and select 'File Transfer' or 'MTP' mode\n\n"
+
+    "Note: Menu names may vary by Android version:\n"
+    "• Some devices show 'Developer options' under 'System'\n"
+    "• Others may have it directly in the main Settings menu\n"
+    "• Samsung devices might show 'Software information' instead of 'About phone'\n\n"
+
+    "If you're still having trouble:\n"
+    "• Try a different USB cable or port (some cables only support charging)\n"
+    "• Restart both your phone and computer\n"
+    "• Make sure your phone screen is unlocked when connecting\n"
+    "• Set your phone screen timeout to 30 minutes (especially for long transfers)\n\n"
+    "• Use a different computer to test if the issue is computer-specific\n"
+
+    "Windows users: If you see a driver installation popup, please allow it to complete.\n"
+    "Linux users: You may need to run 'sudo usermod -a -G plugdev $USER' and reboot.\n"
+
+    "After completing these steps, click 'Recheck for connected Android device' to try again."
+)
 
 
 class DialogManager:
@@ -19,43 +70,11 @@ class DialogManager:
             parent_window: The main window instance
         """
         self.parent = parent_window
-        self.troubleshooting_steps = (
-            "Android device appears to have been disconnected and/or USB debugging is disabled.\n"
-            "Please ensure your Android device is securely connected at both ends.\n\n"
-            
-            "To enable USB debugging:\n"
-            "1. Connect your device to the computer via USB\n"
-            "2. Open Settings → About phone\n"
-            "3. Tap 'Build number' seven times to unlock Developer Options\n"
-            "   (You only need to do this once unless you disable it, reset settings, or wipe your device)\n"
-            "4. Navigate back and go to System → Developer Options\n"
-            "5. Find and enable 'USB debugging'\n"
-            "   (Tip: Use the search icon at the top if you can't find it)\n"
-            "6. Connect via USB and tap 'Trust' when prompted\n"
-            "   (Checking 'Remember' is recommended for future transfers)\n\n"
-            
-            "Ensure File Transfer mode is enabled:\n"
-            "1. After connecting, swipe down to view notifications\n"
-            "2. Look for a USB notification (often shows 'Charging over USB')\n"
-            "3. Tap the notification and select 'File Transfer' or 'MTP' mode\n\n"
-            
-            "Note: Menu names may vary by Android version:\n"
-            "• Some devices show 'Developer options' under 'System'\n"
-            "• Others may have it directly in the main Settings menu\n"
-            "• Samsung devices might show 'Software information' instead of 'About phone'\n\n"
-            
-            "If you're still having trouble:\n"
-            "• Try a different USB cable or port (some cables only support charging)\n"
-            "• Restart both your phone and computer\n"
-            "• Make sure your phone screen is unlocked when connecting\n"
-            "• Set your phone screen timeout to 30 minutes (especially for long transfers)\n\n"
-            "• Use a different computer to test if the issue is computer-specific\n"
-            
-            "Windows users: If you see a driver installation popup, please allow it to complete.\n"
-            "Linux users: You may need to run 'sudo usermod -a -G plugdev $USER' and reboot.\n"
-            
-            "After completing these steps, click 'Recheck for connected Android device' to try again."
-        )
+        # USB debugging dialog, built on first use and reused afterwards
+        self._debug_dialog: Optional[tk.Toplevel] = None
+        self._debug_dialog_callback: Optional[Callable[[], None]] = None
+        # Whether _STATS_LABEL_STYLE has been configured yet
+        self._stats_style_ready = False
     
     def show_file_folder_selection_notice(self) -> bool:
         """Show instructions for file and folder selection in a custom dialog.
@@ -63,23 +82,22 @@ class DialogManager:
         Returns:
             True if user clicked OK, False if user cancelled or closed dialog
         """
-        # Create custom dialog window
+        # Create custom dialog window, hidden until it is fully built so it
+        # is laid out and drawn once
         dialog = tk.Toplevel(self.parent)
+        dialog.withdraw()
         dialog.title("File/Folder Selection Notice")
-        dialog.geometry("600x250")
         dialog.minsize(600, 250)
         dialog.resizable(True, True)
         dialog.transient(self.parent)
-        dialog.grab_set()
         
         # Center the dialog on the parent window
-        dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (600 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (250 // 2)
         dialog.geometry(f"600x250+{x}+{y}")
         
-        # Track if OK was clicked
-        dialog_confirmed = False
+        # Set by either close route; waiting on it returns as soon as it is written
+        confirmed = tk.BooleanVar(master=dialog, value=False)
         
         # Create main frame
         main_frame = tk.Frame(dialog)
@@ -101,165 +119,133 @@ class DialogManager:
             justify="left",
             anchor="nw",
             wraplength=0,  # Will be set dynamically
-            font=("Arial", 10)
+            font=_DIALOG_FONT
         )
         text_label.pack(fill="both", expand=True, pady=(0, 20))
         
-        # OK button with confirmation callback
-        def on_ok_clicked():
-            nonlocal dialog_confirmed
-            dialog_confirmed = True
-            dialog.destroy()
-        
+        # OK button confirms the notice
         ok_button = tk.Button(
             main_frame,
             text="OK",
-            command=on_ok_clicked,
+            command=lambda: confirmed.set(True),
             width=10,
-            font=("Arial", 10)
+            font=_DIALOG_FONT
         )
         ok_button.pack(pady=10)
         
-        # Configure text wrapping on dialog resize
+        # Configure text wrapping on dialog resize; a burst of Configure
+        # events during a drag collapses into one update per debounce window
+        wrap_job = None
+
+        def apply_wraplength():
+            nonlocal wrap_job
+            wrap_job = None
+            # Available width for text (20px padding * 2 + some margin),
+            # never narrower than a reasonable minimum
+            text_label.config(wraplength=max(200, dialog.winfo_width() - 60))
+
         def on_dialog_configure(event):
-            if event.widget == dialog:
-                # Calculate available width for text (account for padding and margins)
-                available_width = dialog.winfo_width() - 60  # 20px padding * 2 + some margin
-                if available_width > 200:  # Minimum reasonable width
-                    text_label.config(wraplength=available_width)
+            nonlocal wrap_job
+            if event.widget is not dialog:
+                return
+            if wrap_job is not None:
+                dialog.after_cancel(wrap_job)
+            wrap_job = dialog.after(WRAP_DEBOUNCE_MS, apply_wraplength)
         
         dialog.bind("<Configure>", on_dialog_configure)
         
         # Set initial wrap length
-        dialog.after(10, lambda: on_dialog_configure(type('Event', (), {'widget': dialog})()))
+        dialog.after(10, apply_wraplength)
         
         # Handle window close (X button) - treat as cancel
-        def on_dialog_close():
-            nonlocal dialog_confirmed
-            dialog_confirmed = False
-            dialog.destroy()
-        
-        dialog.protocol("WM_DELETE_WINDOW", on_dialog_close)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: confirmed.set(False))
+
+        # Show the finished dialog; a grab needs a viewable window
+        dialog.deiconify()
+        dialog.grab_set()
         
-        # Wait for dialog to close
-        dialog.wait_window()
+        # Wait for OK or close, then tear the dialog down
+        dialog.wait_variable(confirmed)
+        result = confirmed.get()
+        dialog.destroy()
         
-        return dialog_confirmed
+        return result
     
     def show_enable_debugging_instructions(self, callback: Optional[callable] = None) -> None:
         """Show instructions to connect device, enable file transfer, and enable USB debugging.
         
+        The dialog is built on first use and then hidden rather than destroyed,
+        so repeated failed rechecks only re-show it.
+
         Args:
             callback: Optional callback to execute after dialog is closed
         """
-        # Create custom dialog window
-        dialog = tk.Toplevel(self.parent)
-        dialog.title("Check device connection and enable USB Debugging")
-        dialog.geometry("700x800")  # Increased height for better button spacing
-        dialog.minsize(700, 800)  # Set minimum size to ensure all content is visible
-        dialog.resizable(True, True)
-        dialog.transient(self.parent)
-        dialog.grab_set()
+        self._debug_dialog_callback = callback
+        if self._debug_dialog is None or not self._debug_dialog.winfo_exists():
+            self._debug_dialog = self._build_debug_dialog()
+        dialog = self._debug_dialog
         
         # Center the dialog on the parent window
-        dialog.update_idletasks()
         x = self.parent.winfo_x() + (self.parent.winfo_width() // 2) - (700 // 2)
         y = self.parent.winfo_y() + (self.parent.winfo_height() // 2) - (450 // 2)
         dialog.geometry(f"700x450+{x}+{y}")
+
+        # Show the finished dialog; a grab needs a viewable window
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _build_debug_dialog(self) -> tk.Toplevel:
+        """Create the hidden USB debugging instructions dialog.
+
+        Returns:
+            The withdrawn dialog window
+        """
+        # Create custom dialog window, hidden until it is shown
+        dialog = tk.Toplevel(self.parent)
+        dialog.withdraw()
+        dialog.title("Check device connection and enable USB Debugging")
+        dialog.minsize(700, 800)  # Set minimum size to ensure all content is visible
+        dialog.resizable(True, True)
+        dialog.transient(self.parent)
         
         # Create main frame
         main_frame = tk.Frame(dialog)
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Create responsive text label
-        text_label = tk.Label(
+        # Read-only text body; Tk word-wraps it natively and reflows on resize
+        text_body = tk.Text(
             main_frame,
-            text=self.troubleshooting_steps,
-            justify="left",
-            anchor="nw",
-            wraplength=0,  # Will be set dynamically
-            font=("Arial", 10)
+            wrap="word",
+            font=_DIALOG_FONT,
+            borderwidth=0,
+            highlightthickness=0,
+            background=dialog.cget("background")
         )
-        text_label.pack(fill="both", expand=True, pady=(0, 20))
+        text_body.insert("1.0", _TROUBLESHOOTING_STEPS)
+        text_body.configure(state="disabled")
+        text_body.pack(fill="both", expand=True, pady=(0, 20))
         
-        # OK button
+        # OK button; closing by either route hides the dialog and runs the callback
         ok_button = tk.Button(
             main_frame,
             text="OK",
-            command=dialog.destroy,
+            command=self._close_debug_dialog,
             width=10,
-            font=("Arial", 10)
+            font=_DIALOG_FONT
         )
         ok_button.pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_debug_dialog)
         
-        # Configure text wrapping on dialog resize
-        def on_dialog_configure(event):
-            if event.widget == dialog:
-                # Calculate available width for text (account for padding and margins)
-                available_width = dialog.winfo_width() - 60  # 20px padding * 2 + some margin
-                if available_width > 200:  # Minimum reasonable width
-                    text_label.config(wraplength=available_width)
-        
-        dialog.bind("<Configure>", on_dialog_configure)
-        
-        # Set initial wrap length
-        dialog.after(10, lambda: on_dialog_configure(type('Event', (), {'widget': dialog})()))
-        
-        # Handle dialog close
-        def on_close():
-            dialog.destroy()
-            if callback:
-                callback()
-        
-        # After user clicks OK, ensure callback is executed
-        dialog.protocol("WM_DELETE_WINDOW", on_close)
-        ok_button.config(command=on_close)
-    
-    def show_disable_debugging_reminder(self) -> None:
-        """Show reminder to disable USB debugging after transfer."""
-        msg = (
-            "Transfer completed!\n\n"
-            "For security, please disable USB debugging when done:\n"
-            "Settings → Developer Options → disable 'USB debugging'."
-        )
-        messagebox.showinfo("Disable USB Debugging", msg)
-    
-    def show_transfer_stats(self, stats: dict, operation: str, deduplicator=None) -> None:
-        """Show transfer statistics dialog.
-        
-        Args:
-            stats: Dictionary containing transfer statistics
-            operation: Type of operation ("Pull" or "Push")
-            deduplicator: Optional deduplicator instance for byte formatting
-        """
-        # Format bytes saved
-        bytes_saved_str = ""
-        if stats['bytes_saved'] > 0:
-            if deduplicator and hasattr(deduplicator, 'format_bytes'):
-                bytes_saved_str = f" ({deduplicator.format_bytes(stats['bytes_saved'])} saved)"
-            else:
-                bytes_saved_str = f" ({stats['bytes_saved']} bytes saved)"
-        
-        # Build message
-        title = f"{operation} Transfer Complete"
-        
-        if stats['total_files'] == 0:
-            message = "No files were found to transfer."
-        else:
-            message_parts = [
-                f"Transfer completed successfully!\n",
-                f"Files found: {stats['total_files']}",
-                f"Files transferred: {stats['transferred']}",
-                f"Duplicate files skipped: {stats['skipped']}{bytes_saved_str}"
-            ]
-            
-            if stats['skipped'] > 0:
-                message_parts.append(f"\nDuplicate detection helped avoid unnecessary transfers!")
-            
-            message = "\n".join(message_parts)
-        
-        # Show dialog
-        messagebox.showinfo(title, message)
+        return dialog
+
+    def _close_debug_dialog(self) -> None:
+        """Hide the USB debugging dialog and run the pending callback."""
+        self._debug_dialog.grab_release()
+        self._debug_dialog.withdraw()
+        callback, self._debug_dialog_callback = self._debug_dialog_callback, None
+        if callback:
+            callback()
     
     def show_error(self, title: str, message: str) -> None:
         """Show an error dialog.
@@ -279,49 +265,59 @@ class DialogManager:
         """
         messagebox.showinfo(title, message)
     
-    def browse_local_file_or_folder(self, direction: str, initial_dir: Optional[str] = None) -> Optional[str]:
+    def browse_local_file_or_folder(
+        self,
+        direction: str,
+        on_selected: Callable[[Optional[str]], None],
+        initial_dir: Optional[str] = None
+    ) -> None:
         """Browse for local file or folder based on transfer direction.
         
+        The native picker blocks the Tk event loop while it is open, so it is
+        opened from the next idle slot (after pending redraws and animation
+        frames) and the result is delivered to a callback.
+
         Args:
             direction: Transfer direction ('pull' or 'push')
+            on_selected: Called with the selected path, or None if cancelled
             initial_dir: Initial directory to open browser in
-            
-        Returns:
-            Selected path or None if cancelled
         """
         if initial_dir is None:
             initial_dir = os.path.expanduser("~")
         
         # Show helpful notification about folder selection behavior
         if not self.show_file_folder_selection_notice():
-            return None  # User cancelled the notice dialog
-        
-        if direction == "push":
-            # For push, show file selection first, then folder selection if cancelled
-            
-            # First try file selection
-            selected_path = filedialog.askopenfilename(
-                title="Select file to push to Android device",
-                initialdir=initial_dir,
-                filetypes=[("All files", "*.*")]
-            )
-            
-            # If no file was selected, offer folder selection as an alternative
-            if not selected_path:
+            on_selected(None)  # User cancelled the notice dialog
+            return
+
+        def ask_path() -> None:
+            from tkinter import filedialog
+
+            if direction == "push":
+                # For push, show file selection first, then folder selection if cancelled
+                
+                # First try file selection
+                selected_path = filedialog.askopenfilename(
+                    title="Select file to push to Android device",
+                    initialdir=initial_dir,
+                    filetypes=[("All files", "*.*")]
+                )
+                
+                # If no file was selected, offer folder selection as an alternative
+                if not selected_path:
+                    selected_path = filedialog.askdirectory(
+                        title="Select folder to push to Android device",
+                        initialdir=initial_dir
+                    )
+            else:  # pull direction
+                # For pull, only allow folder selection (destination)
                 selected_path = filedialog.askdirectory(
-                    title="Select folder to push to Android device",
+                    title="Select destination folder for pulled files",
                     initialdir=initial_dir
                 )
-            
-            return selected_path if selected_path else None
-            
-        else:  # pull direction
-            # For pull, only allow folder selection (destination)
-            folder = filedialog.askdirectory(
-                title="Select destination folder for pulled files",
-                initialdir=initial_dir
-            )
-            return folder if folder else None
+            on_selected(selected_path if selected_path else None)
+
+        self.parent.after_idle(ask_path)
     
     def show_file_folder_choice(self, on_file_callback, on_folder_callback):
         """Show a dialog to choose between file or folder selection.
@@ -348,38 +344,48 @@ class DialogManager:
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         tk.Label(main_frame, text="What would you like to select?", 
-                font=("Arial", 11)).pack(pady=(0, 15))
+                font=_CHOICE_PROMPT_FONT).pack(pady=(0, 15))
         
         button_frame = tk.Frame(main_frame)
         button_frame.pack(fill="x")
         
+        # The callbacks open blocking native pickers; run them once the
+        # choice window is gone and pending redraws are done
         def select_file():
             choice_window.destroy()
-            on_file_callback()
+            self.parent.after_idle(on_file_callback)
         
         def select_folder():
             choice_window.destroy()
-            on_folder_callback()
+            self.parent.after_idle(on_folder_callback)
         
         def cancel_selection():
             choice_window.destroy()
         
         tk.Button(button_frame, text="📄 File", command=select_file, 
-                 width=12, font=("Arial", 10)).pack(side="left", padx=(0, 10))
+                 width=12, font=_DIALOG_FONT).pack(side="left", padx=(0, 10))
         tk.Button(button_frame, text="📁 Folder", command=select_folder, 
-                 width=12, font=("Arial", 10)).pack(side="left", padx=(0, 10))
+                 width=12, font=_DIALOG_FONT).pack(side="left", padx=(0, 10))
         tk.Button(button_frame, text="Cancel", command=cancel_selection, 
                  width=12).pack(side="right")
     
-    def show_transfer_stats(self, stats: dict, operation: str):
+    def show_transfer_stats(self, stats: dict, operation: str, deduplicator=None) -> None:
         """Show transfer statistics in a dialog.
         
         Args:
             stats: Dictionary containing transfer statistics
             operation: Description of the operation performed
+            deduplicator: Optional deduplicator instance for byte formatting
         """
         if not stats:
             return
+
+        from tkinter import ttk
+
+        if not self._stats_style_ready:
+            # Style lookups by name reuse the font Tk resolves here
+            ttk.Style(self.parent).configure(_STATS_LABEL_STYLE, font=_STATS_FONT)
+            self._stats_style_ready = True
             
         stats_window = tk.Toplevel(self.parent)
         stats_window.title("Transfer Statistics")
@@ -399,22 +405,29 @@ class DialogManager:
         
         # Title
         title_label = tk.Label(main_frame, text=f"📊 Transfer Complete - {operation.title()}", 
-                              font=("Arial", 14, "bold"))
+                              font=_STATS_TITLE_FONT)
         title_label.pack(pady=(0, 15))
         
-        # Stats display
-        stats_text = tk.Text(main_frame, wrap=tk.WORD, font=("Courier", 10), 
-                            height=12, width=50)
-        stats_text.pack(fill="both", expand=True, pady=(0, 15))
-        
-        # Format and insert stats
+        # Format stats
         stats_content = []
         for key, value in stats.items():
+            if key == 'bytes_saved' and deduplicator and hasattr(deduplicator, 'format_bytes'):
+                value = deduplicator.format_bytes(value)
             formatted_key = key.replace('_', ' ').title()
             stats_content.append(f"{formatted_key}: {value}")
         
-        stats_text.insert(tk.END, "\n".join(stats_content))
-        stats_text.config(state=tk.DISABLED)
+        if stats.get('skipped', 0) > 0:
+            stats_content.append("\nDuplicate detection helped avoid unnecessary transfers!")
+        
+        # Static text needs no Text widget buffer or state toggling
+        ttk.Label(
+            main_frame,
+            text="\n".join(stats_content),
+            style=_STATS_LABEL_STYLE,
+            justify="left",
+            anchor="nw",
+            wraplength=360  # Window width less padding
+        ).pack(fill="both", expand=True, pady=(0, 15))
         
         # Close button
         tk.Button(main_frame, text="Close", 
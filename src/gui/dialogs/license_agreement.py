@@ -3,17 +3,65 @@ License Agreement Module
 Handles MIT license agreement functionality.
 """
 
+import functools
 import os
 import sys
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
-import tempfile
-import stat
-import subprocess
-import sys
-import os
+from types import MappingProxyType
+from typing import Optional
+
+try:
+    from ...core.platform_utils import IS_WINDOWS
+except ImportError:
+    from core.platform_utils import IS_WINDOWS
+
+
+# Shown in the agreement frame; bound once at import
+_MIT_LICENSE_TEXT = """MIT License
+
+Copyright (c) 2025 Jason Ross
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
 
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE."""
+
+# Fonts used by LicenseAgreementFrame
+_HEADER_FONT = ("Arial", 16, "bold")
+_BODY_FONT = ("Arial", 10)
+_MONO_FONT = ("Courier", 9)
+_BUTTON_FONT = ("Arial", 11, "bold")
+_NOTE_FONT = ("Arial", 9)
+
+# Shared, read-only option sets for the agreement buttons
+_AGREE_BUTTON_OPTIONS = MappingProxyType(
+    {"bg": "#4CAF50", "fg": "white", "width": 15, "height": 2}
+)
+_DISAGREE_BUTTON_OPTIONS = MappingProxyType(
+    {"bg": "#ff6b6b", "fg": "white", "width": 15, "height": 2}
+)
+
+# Written beside the license file once the Windows first-run installer was launched
+FIRST_RUN_MARKER_NAME = "first_run_done"
 
+# Agreement state once read from disk; it only changes through save_license_agreement()
+_license_agreed_cache: Optional[bool] = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_license_file_path() -> str:
     """Return the per-user license-agreed file path.
 
@@ -21,13 +69,14 @@ def get_license_file_path() -> str:
     - On Linux/macOS this will typically use ~/.config or ~/.android-file-handler fallback.
     - On Windows it prefers %APPDATA% (via platformdirs) and falls back to ~.
     """
-    try:
-        from platformdirs import user_config_dir
-    except Exception:
-        user_config_dir = None
-
     if getattr(sys, "frozen", False):
-        # Running as executable: prefer platform dirs
+        # Running as executable: prefer platform dirs. Dev runs never need
+        # platformdirs, so it is only imported here
+        try:
+            from platformdirs import user_config_dir
+        except ImportError:
+            user_config_dir = None
+
         if user_config_dir:
             config_dir = os.path.join(user_config_dir("android-file-handler"), "")
         else:
@@ -40,43 +89,90 @@ def get_license_file_path() -> str:
         return os.path.join(app_dir, "dev-mode_license_agreed.ini")
 
 
+@functools.lru_cache(maxsize=1)
+def _license_dir() -> str:
+    """Return the directory holding the license file and first-run marker."""
+    return os.path.dirname(get_license_file_path())
+
+
 def check_license_agreement() -> bool:
-    """Check if user has already agreed to the license."""
+    """Check if user has already agreed to the license.
+
+    The file is read once per process; later calls return the cached result.
+    """
+    global _license_agreed_cache
+    if _license_agreed_cache is not None:
+        return _license_agreed_cache
+
     license_file = get_license_file_path()
     try:
-        if os.path.exists(license_file):
-            with open(license_file, "r") as f:
-                return f.read().strip() == "1"
-        return False
-    except Exception:
-        return False
+        # The file holds a single "1"; opening it doubles as the existence check
+        fd = os.open(license_file, os.O_RDONLY)
+        try:
+            agreed = os.read(fd, 1) == b"1"
+        finally:
+            os.close(fd)
+    except OSError:
+        agreed = False
+    _license_agreed_cache = agreed
+    return agreed
 
 
-def save_license_agreement() -> bool:
-    """Persist that the user agreed to the license.
+def _write_flag_file(path: str) -> None:
+    """Atomically write a one-byte "1" flag file with owner-only permissions.
 
-    Writes atomically and sets secure file permissions on POSIX.
+    The write is atomic but not durable: no fsync is issued.
+
+    Args:
+        path: Destination file; its directory is created if needed
+
+    Raises:
+        OSError: If the file could not be written
     """
-    license_file = get_license_file_path()
+    parent_dir, name = os.path.split(path)
+
+    # Atomic write to temporary file then rename; the file is created
+    # exclusively with owner-only permissions on POSIX
+    tmp_path = os.path.join(parent_dir, f".{name}.{os.getpid()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
     try:
-        parent_dir = os.path.dirname(license_file)
+        fd = os.open(tmp_path, flags, 0o600)
+    except FileNotFoundError:
+        # The directory usually exists already; only create it when missing
         os.makedirs(parent_dir, exist_ok=True)
-
-        # Atomic write to temporary file then rename
-        fd, tmp_path = tempfile.mkstemp(dir=parent_dir)
+        fd = os.open(tmp_path, flags, 0o600)
+    except FileExistsError:
+        # Left behind by a crashed process that had the same PID
+        os.remove(tmp_path)
+        fd = os.open(tmp_path, flags, 0o600)
+    renamed = False
+    try:
         try:
-            with os.fdopen(fd, "w") as fh:
-                fh.write("1")
-            # Set owner-only permissions on POSIX
-            if os.name == "posix":
-                os.chmod(tmp_path, 0o600)
-            os.replace(tmp_path, license_file)
+            # Unbuffered and deliberately not fsynced: os.replace keeps the
+            # file whole, and a flag lost to a crash only costs one more click
+            os.write(fd, b"1")
         finally:
-            if os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except Exception:
-                    pass
+            os.close(fd)
+        os.replace(tmp_path, path)
+        renamed = True
+    finally:
+        # The temporary file only remains if the rename never happened
+        if not renamed:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def save_license_agreement() -> bool:
+    """Persist that the user agreed to the license.
+
+    Writes atomically and sets secure file permissions on POSIX.
+    """
+    global _license_agreed_cache
+    try:
+        _write_flag_file(get_license_file_path())
+        _license_agreed_cache = True
         return True
     except Exception:
         return False
@@ -84,65 +180,74 @@ def save_license_agreement() -> bool:
 
 def get_mit_license_text():
     """Get the MIT license text."""
-    return """MIT License
+    return _MIT_LICENSE_TEXT
 
-Copyright (c) 2025 Jason Ross
 
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
+@functools.lru_cache(maxsize=None)
+def _resource_base_dir(frozen: bool) -> str:
+    """Return the directory bundled resources are resolved against.
 
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
+    Args:
+        frozen: Whether the app is running as a packaged executable
 
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE."""
+    Returns:
+        Absolute base directory
+    """
+    if frozen:
+        return getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def resource_path(relative_path: str) -> str:
     """Return absolute path to resource for dev and frozen runs."""
     try:
-        if getattr(sys, "frozen", False):
-            base = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
-        else:
-            base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        base = _resource_base_dir(bool(getattr(sys, "frozen", False)))
         return os.path.normpath(os.path.join(base, relative_path))
     except Exception:
         return os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), relative_path))
 
 
-def run_windows_first_run_if_needed() -> None:
-    """If running on Windows and license not agreed, launch first-run installer script.
+@functools.lru_cache(maxsize=1)
+def _first_run_script_path() -> str:
+    """Return the resolved path of the bundled first-run PowerShell script."""
+    return resource_path(os.path.join("scripts", "windows", "first_run_install.ps1"))
+
+
+def _run_windows_first_run() -> None:
+    """If the license is not agreed yet, launch the first-run installer script.
 
     Uses `resource_path` to locate the bundled PowerShell script in both dev and frozen modes.
     """
     try:
-        if not sys.platform.startswith("win"):
+        if check_license_agreement():
             return
 
-        if check_license_agreement():
+        # Launching PowerShell is slow; skip it once the installer has run
+        marker = os.path.join(_license_dir(), FIRST_RUN_MARKER_NAME)
+        if os.path.exists(marker):
             return
 
-        script_rel = os.path.join("scripts", "windows", "first_run_install.ps1")
-        script_path = resource_path(script_rel)
+        script_path = _first_run_script_path()
         if not os.path.exists(script_path):
             return
         try:
+            import subprocess
             subprocess.Popen(["powershell.exe", "-ExecutionPolicy", "Bypass", "-File", script_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            _write_flag_file(marker)
         except Exception:
             pass
     except Exception:
         pass
 
 
+def _noop() -> None:
+    """Do nothing: the first-run installer only exists for Windows."""
+
+
+# Decided once at import so other platforms skip the checks entirely
+run_windows_first_run_if_needed = _run_windows_first_run if IS_WINDOWS else _noop
+
+
 class LicenseAgreementFrame(tk.Frame):
     """License agreement UI frame that can be embedded in the main window."""
 
@@ -155,18 +260,41 @@ class LicenseAgreementFrame(tk.Frame):
         """
         super().__init__(parent)
         self.on_agree_callback = on_agree_callback
+        # Exit confirmation dialog, built on first use and reused afterwards
+        self._confirm_dialog: Optional[tk.Toplevel] = None
+        self._confirm_result: Optional[tk.BooleanVar] = None
+
+        # Configure the frame to fill the window
+        self.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        # Widgets are only built once the frame is actually shown
+        self._map_binding: Optional[str] = self.bind("<Map>", self._build_once)
+
+    def _build_once(self, event=None) -> None:
+        """Build the frame's widgets the first time it is mapped.
+
+        Args:
+            event: Map event (unused)
+        """
+        if self._map_binding is None:
+            return
+        self.unbind("<Map>", self._map_binding)
+        self._map_binding = None
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the license agreement UI."""
-        # Configure the frame to fill the window
-        self.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
+        # Only needed when the agreement has not been given yet
+        from tkinter import font as tkfont
+
+        # Both buttons share one Font so Tk resolves its metrics once
+        button_font = tkfont.Font(font=_BUTTON_FONT)
+
         # Header
         header_label = tk.Label(
             self, 
             text="License Agreement", 
-            font=("Arial", 16, "bold")
+            font=_HEADER_FONT
         )
         header_label.pack(pady=(0, 10))
         
@@ -174,7 +302,7 @@ class LicenseAgreementFrame(tk.Frame):
         instruction_label = tk.Label(
             self, 
             text="Please read and accept the license agreement to continue using Android File Handler:",
-            font=("Arial", 10),
+            font=_BODY_FONT,
             wraplength=500
         )
         instruction_label.pack(pady=(0, 15))
@@ -183,23 +311,27 @@ class LicenseAgreementFrame(tk.Frame):
         text_frame = tk.Frame(self)
         text_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        self.license_text = scrolledtext.ScrolledText(
+        # The license text is already wrapped at 80 columns, so the widget
+        # does not word-wrap it again
+        scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.license_text = tk.Text(
             text_frame, 
-            wrap=tk.WORD, 
+            wrap=tk.NONE, 
             width=80, 
             height=20,
-            font=("Courier", 9),
-            state=tk.DISABLED,
+            font=_MONO_FONT,
             bg="#f8f8f8",
             relief=tk.SUNKEN,
-            bd=2
+            bd=2,
+            state=tk.DISABLED,
+            yscrollcommand=scrollbar.set
         )
-        self.license_text.pack(fill=tk.BOTH, expand=True)
+        self.license_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.license_text.yview)
         
-        # Insert license text
-        self.license_text.config(state=tk.NORMAL)
-        self.license_text.insert(tk.END, get_mit_license_text())
-        self.license_text.config(state=tk.DISABLED)
+        # The text is filled in after the first paint instead of before it
+        self.after_idle(self._populate_license)
         
         # Button frame
         button_frame = tk.Frame(self)
@@ -210,11 +342,8 @@ class LicenseAgreementFrame(tk.Frame):
             button_frame, 
             text="I Agree", 
             command=self.on_agree,
-            bg="#4CAF50",
-            fg="white", 
-            font=("Arial", 11, "bold"),
-            width=15,
-            height=2
+            font=button_font,
+            **_AGREE_BUTTON_OPTIONS
         )
         self.agree_btn.pack(side=tk.LEFT)
         
@@ -222,11 +351,8 @@ class LicenseAgreementFrame(tk.Frame):
             button_frame, 
             text="Disagree & Exit", 
             command=self.on_disagree,
-            bg="#ff6b6b",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            width=15,
-            height=2
+            font=button_font,
+            **_DISAGREE_BUTTON_OPTIONS
         )
         self.disagree_btn.pack(side=tk.RIGHT)
         
@@ -234,14 +360,23 @@ class LicenseAgreementFrame(tk.Frame):
         center_label = tk.Label(
             button_frame,
             text="You must agree to the license terms to use this software",
-            font=("Arial", 9),
+            font=_NOTE_FONT,
             fg="#666666"
         )
         center_label.pack(expand=True)
     
+    def _populate_license(self) -> None:
+        """Insert the license into the read-only text area."""
+        self.license_text.config(state=tk.NORMAL)
+        self.license_text.insert(tk.END, _MIT_LICENSE_TEXT)
+        self.license_text.config(state=tk.DISABLED)
+
     def on_agree(self):
         """Handle user clicking Agree."""
-        if save_license_agreement():
+        from tkinter import messagebox
+
+        # A repeated click finds the cached agreement and skips the write
+        if check_license_agreement() or save_license_agreement():
             self.on_agree_callback()
         else:
             messagebox.showerror(
@@ -252,10 +387,55 @@ class LicenseAgreementFrame(tk.Frame):
     def on_disagree(self):
         """Handle user clicking Disagree."""
         # Ask for confirmation
-        result = messagebox.askyesno(
-            "Exit Application",
-            "Are you sure you want to exit? You must agree to the license terms to use this software.",
-            icon="warning"
-        )
-        if result:
-            sys.exit(0)
+        if self._ask_exit_confirmation():
+            # Ending the main loop lets the app exit without raising SystemExit
+            self.winfo_toplevel().destroy()
+
+    def _ask_exit_confirmation(self) -> bool:
+        """Ask whether to exit, reusing one hidden confirmation dialog.
+
+        Returns:
+            True if the user confirmed exiting, False otherwise
+        """
+        if self._confirm_dialog is None or not self._confirm_dialog.winfo_exists():
+            self._build_confirm_dialog()
+        dialog = self._confirm_dialog
+
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        # Returns as soon as a button or the close box sets the result
+        dialog.wait_variable(self._confirm_result)
+        dialog.grab_release()
+        dialog.withdraw()
+        return self._confirm_result.get()
+
+    def _build_confirm_dialog(self) -> None:
+        """Create the hidden exit confirmation dialog."""
+        dialog = tk.Toplevel(self)
+        dialog.withdraw()
+        dialog.title("Exit Application")
+        dialog.resizable(False, False)
+        dialog.transient(self.winfo_toplevel())
+        result = tk.BooleanVar(master=dialog, value=False)
+
+        tk.Label(
+            dialog,
+            text="Are you sure you want to exit? You must agree to the license terms to use this software.",
+            font=_BODY_FONT,
+            wraplength=360,
+            justify=tk.LEFT
+        ).pack(padx=20, pady=(20, 15))
+
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=(0, 15))
+        tk.Button(
+            button_frame, text="Yes", width=10, command=lambda: result.set(True)
+        ).pack(side=tk.LEFT, padx=5)
+        tk.Button(
+            button_frame, text="No", width=10, command=lambda: result.set(False)
+        ).pack(side=tk.LEFT, padx=5)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: result.set(False))
+
+        self._confirm_dialog = dialog
+        self._confirm_result = result
@@ -4,11 +4,33 @@ Manages all GUI animations for the Android file transfer application.
 """
 
 import tkinter as tk
-from typing import Optional, Dict, Any
+from typing import Optional, Tuple
+
+
+# The animations cycle through 1-5 trailing dots
+ANIMATION_FRAME_COUNT = 5
+# Delay between animation frames
+ANIMATION_INTERVAL_MS = 500
 
 
 class AnimationHandler:
     """Handles all GUI animations including transfer and scanning animations."""
+
+    # Fixed attribute layout: no per-instance __dict__ for the per-tick reads
+    __slots__ = (
+        "parent",
+        "animation_job",
+        "animation_dots",
+        "scanning_active",
+        "_last_status_text",
+        "_transfer_counts",
+        "_tick_job",
+    )
+
+    # Every frame is known up front, so build the strings once
+    _DOTS = tuple("." * (i + 1) for i in range(ANIMATION_FRAME_COUNT))
+    _SCAN_FRAMES = tuple(f"Scanning for duplicates{dots}" for dots in _DOTS)
+    _TRANSFER_FRAMES = tuple(f"Transferring{dots}" for dots in _DOTS)
     
     def __init__(self, parent_window: tk.Tk):
         """Initialize the animation handler.
@@ -17,77 +39,88 @@ class AnimationHandler:
             parent_window: The main window instance
         """
         self.parent = parent_window
+        # Name of the running animation ("scanning" or "transfer"), or None
         self.animation_job: Optional[str] = None
         self.animation_dots = 0
         self.scanning_active = False
+        # Text most recently written by this handler, to skip identical updates
+        self._last_status_text: Optional[str] = None
         
-        # File transfer progress tracking
-        self.transfer_file_progress = {
-            'current': 0,
-            'total': 0,
-            'active': False
-        }
+        # File transfer progress as (current, total); replaced in one assignment
+        # so worker threads never leave a half-updated pair for the animator
+        self._transfer_counts: Tuple[int, int] = (0, 0)
+
+        # A single periodic driver renders whichever animation is enabled,
+        # instead of each frame arming a new one-shot timer
+        self._tick_job = self.parent.after(ANIMATION_INTERVAL_MS, self._tick)
     
     def start_scanning_animation(self) -> None:
         """Start the 'Scanning for duplicates...' animation."""
         self.animation_dots = 0
         self.scanning_active = True
-        self.animation_job = self.parent.after(0, self._animate_scanning_text)
+        self.animation_job = "scanning"
+        # Show the first frame now rather than on the next tick
+        self.parent.after_idle(self._animate_scanning_text)
     
     def start_transfer_animation(self) -> None:
         """Start the 'Transferring...' animation."""
         self.animation_dots = 0
         self.scanning_active = False
-        self.animation_job = self.parent.after(0, self._animate_transfer_text)
+        self.animation_job = "transfer"
+        # Show the first frame now rather than on the next tick
+        self.parent.after_idle(self._animate_transfer_text)
     
     def stop_animation(self) -> None:
         """Stop any running animation."""
-        if self.animation_job is not None:
-            self.parent.after_cancel(self.animation_job)
-            self.animation_job = None
+        self.animation_job = None
         
         self.scanning_active = False
+        # Other code may write the label while no animation runs
+        self._last_status_text = None
         self._reset_file_progress()
     
     def update_transfer_progress(self, current: int, total: int) -> None:
         """Update the file transfer progress.
         
+        Safe to call from any thread for every file: nothing is scheduled on
+        the UI thread, the animator just reads the latest counts on its tick.
+
         Args:
             current: Current number of files transferred
             total: Total number of files to transfer
         """
-        self.transfer_file_progress['current'] = current
-        self.transfer_file_progress['total'] = total
-        self.transfer_file_progress['active'] = True
+        self._transfer_counts = (current, total)
     
+    def _tick(self) -> None:
+        """Render the next frame of the enabled animation and re-arm the driver."""
+        try:
+            if self.animation_job is not None:
+                if self.scanning_active:
+                    self._animate_scanning_text()
+                else:
+                    self._animate_transfer_text()
+        finally:
+            self._tick_job = self.parent.after(ANIMATION_INTERVAL_MS, self._tick)
+
     def _animate_scanning_text(self) -> None:
         """Animate the scanning text with dots."""
         if self.animation_job is not None and self.scanning_active:
-            dots = "." * (self.animation_dots + 1)
-            status_text = f"Scanning for duplicates{dots}"
-            self._update_status_label(status_text)
-            self.animation_dots = (self.animation_dots + 1) % 5  # Cycle 0-4 dots
-            # Schedule next update in 500ms
-            self.animation_job = self.parent.after(500, self._animate_scanning_text)
+            self._update_status_label(self._SCAN_FRAMES[self.animation_dots])
+            self.animation_dots = (self.animation_dots + 1) % ANIMATION_FRAME_COUNT
     
     def _animate_transfer_text(self) -> None:
         """Animate the transfer text with dots."""
         if self.animation_job is not None and not self.scanning_active:
-            dots = "." * (self.animation_dots + 1)
-            
             # Show file progress if available
-            if (self.transfer_file_progress['active'] and 
-                self.transfer_file_progress['total'] > 0):
-                current = self.transfer_file_progress['current']
-                total = self.transfer_file_progress['total']
+            current, total = self._transfer_counts
+            if total > 0:
+                dots = self._DOTS[self.animation_dots]
                 status_text = f"Transferring {current} of {total} files{dots}"
             else:
-                status_text = f"Transferring{dots}"
+                status_text = self._TRANSFER_FRAMES[self.animation_dots]
                 
             self._update_status_label(status_text)
-            self.animation_dots = (self.animation_dots + 1) % 5  # Cycle 0-4 dots
-            # Schedule next update in 500ms
-            self.animation_job = self.parent.after(500, self._animate_transfer_text)
+            self.animation_dots = (self.animation_dots + 1) % ANIMATION_FRAME_COUNT
     
     def _update_status_label(self, text: str) -> None:
         """Update the status label with the given text.
@@ -95,17 +128,16 @@ class AnimationHandler:
         Args:
             text: Text to display in the status label
         """
+        if text == self._last_status_text:
+            return
         if hasattr(self.parent, 'status_label'):
-            self.parent.status_label.config(text=text)
-            self.parent.update_idletasks()
+            # Setting the bound variable lets Tk redraw on its own idle cycle
+            self.parent.status_label.set_text(text)
+            self._last_status_text = text
     
     def _reset_file_progress(self) -> None:
         """Reset file progress tracking."""
-        self.transfer_file_progress = {
-            'current': 0,
-            'total': 0,
-            'active': False
-        }
+        self._transfer_counts = (0, 0)
     
     def is_animation_running(self) -> bool:
         """Check if any animation is currently running.
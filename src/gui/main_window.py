@@ -6,7 +6,7 @@ Core GUI application window for Android file transfers using modular components.
 import os
 import threading
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox
 
 try:
     # Try relative import first (when used as module)
@@ -39,6 +39,10 @@ except ImportError:
     from managers.transfer_manager import TransferManager
 
 
+# Status messages from worker threads are coalesced to at most one redraw per interval
+STATUS_FLUSH_INTERVAL_MS = 33
+
+
 class AndroidFileHandlerGUI(tk.Tk):
     """Main GUI application for Android file transfers."""
 
@@ -49,6 +53,13 @@ class AndroidFileHandlerGUI(tk.Tk):
         # Transfer tracking for thread safety
         self.current_transfer_id = 0
         self.device_connected = False
+
+        # Latest status posted from a worker thread, awaiting the next flush
+        self._pending_status = None
+        self._status_flush_scheduled = False
+
+        # Android browser, created on first use
+        self._android_browser = None
         
         # Initialize modular components
         self.license_manager = LicenseManager(self)
@@ -116,6 +127,8 @@ class AndroidFileHandlerGUI(tk.Tk):
             self.browse_local_folder
         )
 
+        self._path_selectors = (self.android_path_selector, self.computer_path_selector)
+
         # Initially arrange for pull (Android on top)
         self._arrange_path_sections()
 
@@ -154,14 +167,29 @@ class AndroidFileHandlerGUI(tk.Tk):
         try:
             # Ensure UI updates happen on main thread
             if threading.current_thread() == threading.main_thread():
+                # A direct update supersedes any older message still pending
+                self._pending_status = None
                 self.status_label.set_text(message)
                 self.update_idletasks()
             else:
-                self.after(0, lambda: self._update_status(message))
+                self._pending_status = message
+                if not self._status_flush_scheduled:
+                    self._status_flush_scheduled = True
+                    self.after(STATUS_FLUSH_INTERVAL_MS, self._flush_pending_status)
         except Exception as e:
             # If there's an error updating the UI, print to console
             print(f"Error updating status: {e}")
 
+    def _flush_pending_status(self):
+        """Show the latest status posted from a worker thread, without forcing a redraw."""
+        self._status_flush_scheduled = False
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            try:
+                self.status_label.set_text(message)
+            except Exception as e:
+                print(f"Error updating status: {e}")
+
     def _validate_paths_and_update_button(self):
         """Validate selected paths and update button state accordingly."""
         android_path_valid = self.android_path_selector.is_path_selected()
@@ -180,13 +208,13 @@ class AndroidFileHandlerGUI(tk.Tk):
 
     def _enable_browse_buttons(self):
         """Enable path browse buttons when device is connected."""
-        self.android_path_selector.enable_browse()
-        self.computer_path_selector.enable_browse()
+        for selector in self._path_selectors:
+            selector.enable_browse()
 
     def _disable_browse_buttons(self):
         """Disable path browse buttons when device is not connected."""
-        self.android_path_selector.disable_browse()
-        self.computer_path_selector.disable_browse()
+        for selector in self._path_selectors:
+            selector.disable_browse()
 
     def _initialize_app(self):
         """Initialize the application and check device connection."""
@@ -226,11 +254,19 @@ class AndroidFileHandlerGUI(tk.Tk):
         def on_path_selected(path):
             self.android_path_selector.set_path(path)
             self._validate_paths_and_update_button()
-        browser = AndroidFileBrowser(self, self.adb_manager, on_path_selected)
-        browser.show_browser(direction="pull")
+        # One browser is kept so its directory listing cache outlives each window
+        if self._android_browser is None:
+            self._android_browser = AndroidFileBrowser(
+                self, self.adb_manager, on_path_selected,
+                device_check=self.device_manager.get_cached_device
+            )
+        self._android_browser.show_browser(direction="pull")
         
     def browse_local_folder(self):
         """Browse for local file or folder selection."""
+        # Imported on first use; most sessions never open a file dialog
+        from tkinter import filedialog
+
         def on_file_selected():
             filename = filedialog.askopenfilename(
                 title="Select a file to transfer",
@@ -255,7 +291,7 @@ class AndroidFileHandlerGUI(tk.Tk):
     def recheck_device(self):
         """Recheck for connected Android device."""
         self.transfer_button.set_checking_mode()
-        self.animation_handler.start_scanning_animation("Status: Scanning")
+        self.animation_handler.start_scanning_animation()
         
         def perform_recheck():
             self.device_connected = self.device_manager.check_device_connection()
@@ -278,17 +314,17 @@ class AndroidFileHandlerGUI(tk.Tk):
     def start_transfer(self):
         """Start the file transfer process."""
         try:
-            # Get current values
+            # Get current values (each Tk variable is read once)
             direction = self.direction_selector.get_direction()
             remote_path = self.android_path_selector.get_path()
             local_path = self.computer_path_selector.get_path()
             
             # Validate paths
-            if not self.android_path_selector.is_path_selected():
+            if not self.android_path_selector.is_path_selected(remote_path):
                 messagebox.showerror("Error", "Please select an Android device path.")
                 return
                 
-            if not self.computer_path_selector.is_path_selected():
+            if not self.computer_path_selector.is_path_selected(local_path):
                 messagebox.showerror("Error", "Please select a computer path.")
                 return
             
@@ -300,8 +336,12 @@ class AndroidFileHandlerGUI(tk.Tk):
             
             # Switch to cancel mode and start transfer
             self.transfer_button.set_cancel_mode(self.cancel_transfer)
-            self.animation_handler.start_transfer_animation("Status: Transferring")
+            self.animation_handler.start_transfer_animation()
             
+            # Pushing changes the device, so cached listings go stale
+            if direction == "push" and self._android_browser is not None:
+                self._android_browser.clear_cache()
+
             # Start transfer using transfer manager
             self.transfer_manager.start_transfer(
                 direction, 
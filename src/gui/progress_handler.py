@@ -5,6 +5,11 @@ Handles progress bar updates and status messages in a thread-safe manner.
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional, Tuple
+
+
+# Worker-thread updates are coalesced and applied at most this often (~30 Hz)
+UI_FLUSH_INTERVAL_MS = 33
 
 
 class ProgressHandler:
@@ -19,33 +24,59 @@ class ProgressHandler:
         self.status_label = status_label
         self._last_percentage: float = 0.0
         self._transfer_active: bool = False  # Track if a transfer is actually active
+        # Latest values waiting for the next UI flush
+        # Raw (value, total) as reported; converted to a percentage on flush
+        self._pending_progress: Optional[Tuple[float, Optional[float]]] = None
+        self._pending_status: Optional[str] = None
+        self._ui_tick_scheduled: bool = False
 
     def update_progress(self, bytes_transferred_or_percentage, bytes_total=None) -> None:
         """Update the progress bar (thread-safe).
+
+        Producers should prefer passing raw byte counters: they are stored
+        as-is and only converted to a percentage once per UI tick, keeping
+        the arithmetic off the transfer thread.
         
         Args:
             bytes_transferred_or_percentage: Either bytes transferred (if bytes_total provided) or percentage (0-100)
             bytes_total: Total number of bytes to transfer (optional)
         """
-        if bytes_total is not None:
-            # Called with bytes_transferred and bytes_total
-            bytes_transferred = bytes_transferred_or_percentage
-            if bytes_total > 0:
-                percentage = (bytes_transferred / bytes_total) * 100.0
-            else:
-                percentage = 0.0
+        # Only the latest value is kept; the main thread applies it on the next tick
+        self._pending_progress = (bytes_transferred_or_percentage, bytes_total)
+        self._schedule_flush()
+
+    @staticmethod
+    def _to_percentage(value: float, total: Optional[float]) -> float:
+        """Convert a reported (value, total) pair to a clamped percentage.
+
+        Args:
+            value: Bytes transferred, or a percentage when total is None
+            total: Total number of bytes, or None
+
+        Returns:
+            Percentage between 0.0 and 100.0
+        """
+        if total is not None:
+            percentage = value * 100.0 / total if total > 0 else 0.0
         else:
-            # Called with just percentage
-            percentage = float(bytes_transferred_or_percentage)
-        
-        # Ensure percentage is within valid range
-        percentage = max(0.0, min(100.0, percentage))
-        
-        # Schedule UI update on main thread using a proper closure
-        def update_ui() -> None:
-            self._update_progress_ui(percentage)
+            percentage = float(value)
+        return max(0.0, min(100.0, percentage))
 
-        self.parent.after(0, update_ui)
+    def _schedule_flush(self) -> None:
+        """Schedule a single UI flush if one is not already pending."""
+        if not self._ui_tick_scheduled:
+            self._ui_tick_scheduled = True
+            self.parent.after(UI_FLUSH_INTERVAL_MS, self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Apply the most recent pending progress and status on the main thread."""
+        self._ui_tick_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        message, self._pending_status = self._pending_status, None
+        if progress is not None:
+            self._update_progress_ui(self._to_percentage(*progress))
+        if message is not None:
+            self._set_status_ui(message)
 
     def _update_progress_ui(self, percentage: float) -> None:
         """Internal method to update progress bar on main thread.
@@ -67,8 +98,6 @@ class ProgressHandler:
             elif percentage >= 100:
                 self.progress_bar.stop()  # Stop animation when complete
                 self._transfer_active = False  # Transfer is done
-            
-            self.parent.update_idletasks()
         except Exception as exception_error:
             pass  # Silent error handling
 
@@ -78,8 +107,8 @@ class ProgressHandler:
             try:
                 self.progress_bar.stop()  # Stop any animation
                 self._last_percentage = 0.0
+                self._pending_progress = None
                 self._transfer_active = False  # Not in a transfer
-                self.parent.update_idletasks()
             except Exception as exception_error:
                 pass  # Silent error handling for reset operation
 
@@ -95,11 +124,9 @@ class ProgressHandler:
         Args:
             message: The status message to display
         """
-        # Schedule UI update on main thread
-        def update_ui() -> None:
-            self._set_status_ui(message)
-
-        self.parent.after(0, update_ui)
+        # Coalesced with progress updates; only the latest message is shown
+        self._pending_status = message
+        self._schedule_flush()
 
     def _set_status_ui(self, message: str) -> None:
         """Internal method to set status label on main thread.
@@ -109,6 +136,5 @@ class ProgressHandler:
         """
         try:
             self.status_label.config(text=message)
-            self.parent.update_idletasks()
         except Exception as exception_error:
             pass  # Silent error handling
\ No newline at end of file
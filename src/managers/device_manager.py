@@ -3,9 +3,10 @@ Device Manager Module
 Handles Android device connection and ADB operations for the GUI.
 """
 
+import time
 import tkinter as tk
 from tkinter import messagebox
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 
 try:
     from ..core.adb_manager import ADBManager, is_adb_available
@@ -13,6 +14,10 @@ except ImportError:
     from core.adb_manager import ADBManager, is_adb_available
 
 
+# Seconds a device check result may be reused by get_cached_device()
+DEVICE_CACHE_TTL = 2.0
+
+
 class DeviceManager:
     """Manages Android device connections and ADB operations."""
     
@@ -27,6 +32,8 @@ class DeviceManager:
         self.status_callback = status_callback
         self.adb_manager = ADBManager()
         self.device_connected = False
+        # Last device check result and the monotonic time it was taken
+        self._device_cache: Tuple[Optional[str], float] = (None, float("-inf"))
         
         # Set up ADB callbacks
         self.adb_manager.set_status_callback(self._on_adb_status_update)
@@ -76,7 +83,7 @@ class DeviceManager:
         self._update_status("Checking for connected device...")
         self.parent.update()
         
-        device = self.adb_manager.check_device()
+        device = self._check_device()
         if device:
             self.device_connected = True
             self._update_status(f"Device detected: {device}")
@@ -89,6 +96,30 @@ class DeviceManager:
             )
             return None
     
+    def get_cached_device(self, ttl: float = DEVICE_CACHE_TTL) -> Optional[str]:
+        """Return the connected device, reusing a check made within ttl seconds.
+
+        Args:
+            ttl: Maximum age in seconds of a reusable check result
+
+        Returns:
+            Device ID if connected, None otherwise
+        """
+        device, checked_at = self._device_cache
+        if time.monotonic() - checked_at < ttl:
+            return device
+        return self._check_device()
+
+    def _check_device(self) -> Optional[str]:
+        """Query adb for a connected device and remember the result.
+
+        Returns:
+            Device ID if connected, None otherwise
+        """
+        device = self.adb_manager.check_device()
+        self._device_cache = (device, time.monotonic())
+        return device
+
     def is_remote_file(self, remote_path: str) -> bool:
         """Check if the remote path points to a file (not a directory).
         
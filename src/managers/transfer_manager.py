@@ -3,6 +3,8 @@ Transfer Manager Module
 Handles file transfer operations and coordination between GUI and ADB manager.
 """
 
+import functools
+import queue
 import threading
 import os
 from typing import Optional, Callable, Tuple, Dict, Any
@@ -40,6 +42,10 @@ class TransferManager:
         
         # UI callbacks
         self.ui_callbacks = {}
+
+        # Transfers run one at a time on a single long-lived worker thread
+        self._jobs: queue.Queue = queue.Queue()
+        threading.Thread(target=self._transfer_worker, daemon=True).start()
         
     def set_ui_callback(self, name: str, callback: Callable) -> None:
         """Set a UI callback function.
@@ -94,14 +100,21 @@ class TransferManager:
         if 'disable_controls' in self.ui_callbacks:
             self.ui_callbacks['disable_controls']()
 
-        # Start transfer in background thread
-        transfer_thread = threading.Thread(
-            target=self._transfer_thread,
-            args=(direction, source_path, dest_path, transfer_id, is_file),
-            daemon=True
-        )
-        transfer_thread.start()
+        # Hand the transfer to the background worker
+        self._jobs.put(functools.partial(
+            self._transfer_thread, direction, source_path, dest_path, transfer_id, is_file
+        ))
         return True
+
+    def _transfer_worker(self) -> None:
+        """Run queued transfer jobs in order for the lifetime of the manager."""
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception as e:
+                # Keep the worker alive for later transfers
+                print(f"Error in transfer worker: {e}")
         
     def _is_remote_file(self, remote_path: str) -> bool:
         """Check if a remote path is a file.
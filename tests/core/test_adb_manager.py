@@ -185,6 +185,24 @@ class TestADBManager:
         assert files[1]['type'] == 'file'
         assert files[1]['size'] == 100
     
+    def test_list_files_keeps_spaces_in_names(self):
+        """File names keep their spacing and short lines are skipped."""
+        manager = ADBManager()
+        manager.command_runner.run_adb_command = MagicMock(
+            return_value=(
+                "-rw-rw-r-- 1 user user 2048 Jan  1 12:00 my  file.txt\n"
+                "broken line",
+                "", 0
+            )
+        )
+
+        files = manager.list_files("/sdcard")
+
+        assert len(files) == 1
+        assert files[0]['name'] == 'my  file.txt'
+        assert files[0]['size'] == 2048
+        assert files[0]['modified'] == 'Jan 1 12:00'
+
     def test_list_files_failure(self):
         """Test file listing failure."""
         manager = ADBManager()
@@ -0,0 +1,143 @@
+"""Tests for persistent ADB shell sessions."""
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.core.adb_shell import PersistentAdbShell
+
+
+def _make_process(output: str) -> MagicMock:
+    process = MagicMock()
+    process.poll.return_value = None
+    process.stdout = io.StringIO(output)
+    return process
+
+
+class _StalledOutput:
+    """stdout of a shell that never answers until it is killed."""
+
+    def __init__(self):
+        self.killed = threading.Event()
+
+    def readline(self):
+        self.killed.wait(5)
+        return ""
+
+
+class TestPersistentAdbShell:
+    """Test persistent shell command handling."""
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_run_reads_until_sentinel(self, mock_popen, mock_get_path):
+        """Output is collected up to the sentinel and the exit code parsed."""
+        mock_popen.return_value = _make_process(
+            "drwx folder\n-rw- file\n__AFH_END_0__\n"
+        )
+        shell = PersistentAdbShell("SERIAL")
+
+        stdout, stderr, returncode = shell.run("ls -la /sdcard/")
+
+        assert (stdout, stderr, returncode) == ("drwx folder\n-rw- file", "", 0)
+        assert mock_popen.call_args[0][0] == ['/path/to/adb', '-s', 'SERIAL', 'shell']
+        mock_popen.return_value.stdin.write.assert_called_once_with(
+            "ls -la /sdcard/ 2>&1; echo __AFH_END_$?__\n"
+        )
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_run_reuses_process(self, mock_popen, mock_get_path):
+        """Consecutive commands share one adb process."""
+        mock_popen.return_value = _make_process(
+            "a\n__AFH_END_0__\nb\n__AFH_END_0__\n"
+        )
+        shell = PersistentAdbShell()
+
+        assert shell.run("ls /a")[0] == "a"
+        assert shell.run("ls /b")[0] == "b"
+        mock_popen.assert_called_once()
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_run_failure_returns_output_as_error(self, mock_popen, mock_get_path):
+        """Non-zero exit codes surface the merged output as stderr."""
+        mock_popen.return_value = _make_process(
+            "ls: /data: Permission denied\n__AFH_END_1__\n"
+        )
+        shell = PersistentAdbShell()
+
+        stdout, stderr, returncode = shell.run("ls -la /data/")
+
+        assert returncode == 1
+        assert "Permission denied" in stderr
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_run_session_ended(self, mock_popen, mock_get_path):
+        """A shell that exits mid-command reports an error result."""
+        mock_popen.return_value = _make_process("partial\n")
+        shell = PersistentAdbShell()
+
+        stdout, stderr, returncode = shell.run("ls")
+
+        assert stdout is None
+        assert returncode == -1
+        assert shell.process is None
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_run_times_out(self, mock_popen, mock_get_path):
+        """A command whose sentinel never arrives kills the session."""
+        process = MagicMock()
+        process.poll.return_value = None
+        process.stdout = _StalledOutput()
+        process.kill.side_effect = process.stdout.killed.set
+        mock_popen.return_value = process
+        shell = PersistentAdbShell()
+
+        assert shell.run("ls", timeout=0.05) == (None, "timeout", -1)
+        process.kill.assert_called_once_with()
+        assert shell.process is None
+
+    @patch('src.core.adb_shell.get_adb_binary_path', return_value='/path/to/adb')
+    @patch('subprocess.Popen')
+    def test_close_kills_busy_session_without_waiting(self, mock_popen, mock_get_path):
+        """Closing mid-command kills the shell instead of waiting for exit."""
+        process = MagicMock()
+        process.poll.return_value = None
+        process.stdout = _StalledOutput()
+        process.kill.side_effect = process.stdout.killed.set
+        mock_popen.return_value = process
+        shell = PersistentAdbShell()
+        results = []
+        worker = threading.Thread(target=lambda: results.append(shell.run("sleep 60")))
+        worker.start()
+        while not process.stdin.write.called:
+            time.sleep(0.01)
+
+        started = time.monotonic()
+        shell.close()
+
+        assert time.monotonic() - started < 1.0
+        process.kill.assert_called_once_with()
+        # No "exit" was sent to the busy shell
+        process.stdin.write.assert_called_once_with("sleep 60 2>&1; echo __AFH_END_$?__\n")
+        worker.join(2)
+        assert results[0][0] is None
+
+    @patch('subprocess.Popen')
+    def test_run_after_close(self, mock_popen):
+        """A closed session does not start a new adb process."""
+        shell = PersistentAdbShell()
+        shell.close()
+
+        assert shell.run("ls")[2] == -1
+        mock_popen.assert_not_called()
+
+    def test_close_without_process(self):
+        """Closing an unused session is a no-op."""
+        shell = PersistentAdbShell()
+        shell.close()
+        assert shell.process is None
@@ -11,7 +11,11 @@ from src.core.platform_tools import (
     is_adb_available, 
     get_adb_binary_path,
     ensure_platform_tools_in_user_dir,
-    download_and_extract_adb
+    download_and_extract_adb,
+    _plan_zip_extraction,
+    _extract_zip_members,
+    _download_archive,
+    _find_extracted_dir,
 )
 
 
@@ -40,7 +44,8 @@ class TestPlatformTools(unittest.TestCase):
 
     def test_get_adb_binary_path_local_fallback(self):
         """Test fallback to local platform-tools."""
-        with patch('src.core.platform_tools.ensure_platform_tools_in_user_dir', side_effect=Exception()):
+        with patch('src.core.platform_tools.ensure_platform_tools_in_user_dir', side_effect=Exception()), \
+                patch('src.core.adb_manager.ensure_platform_tools_in_user_dir', side_effect=Exception()):
             with patch('src.core.platform_utils.get_platform_tools_directory', return_value='/local/platform-tools'):
                 with patch('src.core.platform_utils.get_adb_binary_name', return_value='adb'):
                     with patch('os.path.isfile', return_value=True):
@@ -71,7 +76,7 @@ class TestPlatformTools(unittest.TestCase):
             with patch('os.path.islink', return_value=False):
                 with patch('os.path.isdir', side_effect=mock_isdir):
                     with patch('tempfile.mkdtemp', return_value='/tmp/test'):
-                        with patch('os.listdir', return_value=['platform-tools']):  # Mock directory listing
+                        with patch('os.scandir'):  # Mock directory listing
                             with patch('requests.get') as mock_get:
                                 with patch('builtins.open', mock_open()):
                                     with patch('zipfile.is_zipfile', return_value=True):
@@ -84,7 +89,7 @@ class TestPlatformTools(unittest.TestCase):
                                             mock_zip_instance.infolist.return_value = [mock_info]
                                             mock_zip.return_value.__enter__.return_value = mock_zip_instance
 
-                                            with patch('shutil.move'):
+                                            with patch('os.replace'):
                                                 with patch('os.chmod'):
                                                     with patch('os.symlink'):
                                                         with patch('shutil.rmtree'):
@@ -106,7 +111,8 @@ class TestPlatformTools(unittest.TestCase):
                     with patch('os.name', 'posix'):
                         result = download_and_extract_adb()
                         assert result is True
-                        mock_chmod.assert_called_once_with('/test/adb', 0o755)
+                        # Permissions are set once during extraction, not re-applied here
+                        mock_chmod.assert_not_called()
 
     def test_download_and_extract_adb_windows(self):
         """Test ADB download and extraction on Windows."""
@@ -153,6 +159,89 @@ class TestPlatformToolsSecurityValidation:
         # are validated by code review and the SECURITY.md documentation.
         assert True  # Documentation test
 
+    @pytest.mark.parametrize("member", [
+        "../evil",
+        "platform-tools/../../evil",
+        "/etc/passwd",
+        "C:/Windows/evil.dll",
+        "platform-tools\\..\\evil",
+    ])
+    def test_plan_zip_extraction_rejects_traversal(self, member, tmp_path):
+        """Members escaping the extraction root are rejected."""
+        with pytest.raises(RuntimeError, match="path traversal"):
+            _plan_zip_extraction([Mock(filename=member)], str(tmp_path))
+
+    @pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX permissions only")
+    def test_extract_zip_members_marks_adb_executable(self, tmp_path):
+        """Only the named executable gets exec permission during extraction."""
+        import zipfile
+        archive = tmp_path / "tools.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("platform-tools/adb", b"binary")
+            zf.writestr("platform-tools/NOTICE.txt", b"text")
+        out = tmp_path / "out"
+        with zipfile.ZipFile(archive) as zf:
+            _extract_zip_members(zf, _plan_zip_extraction(zf.infolist(), str(out)),
+                                 executable_name="adb")
+        assert os.stat(out / "platform-tools" / "adb").st_mode & 0o777 == 0o755
+        assert not os.stat(out / "platform-tools" / "NOTICE.txt").st_mode & 0o111
+
+    def test_plan_zip_extraction_resolves_targets(self, tmp_path):
+        """Safe members resolve to paths inside the extraction root."""
+        infos = [Mock(filename="platform-tools/"), Mock(filename="platform-tools/adb")]
+        jobs = _plan_zip_extraction(infos, str(tmp_path))
+        root = os.path.realpath(str(tmp_path))
+        assert [target for _, target in jobs] == [
+            os.path.join(root, "platform-tools"),
+            os.path.join(root, "platform-tools", "adb"),
+        ]
+
+    def test_plan_zip_extraction_enforces_size_limit(self, tmp_path):
+        """The uncompressed size limit is checked while planning."""
+        infos = [Mock(filename="platform-tools/a", file_size=600),
+                 Mock(filename="platform-tools/b", file_size=600)]
+        assert len(_plan_zip_extraction(infos, str(tmp_path), max_total_size=1200)) == 2
+        with pytest.raises(RuntimeError, match="size exceeds"):
+            _plan_zip_extraction(infos, str(tmp_path), max_total_size=1000)
+
+    def test_find_extracted_dir_scans_for_prefixed_directory(self, tmp_path):
+        """A versioned platform-tools directory is found; files are ignored."""
+        (tmp_path / "platform-tools.zip").write_bytes(b"")
+        (tmp_path / "Platform-Tools-35").mkdir()
+        assert _find_extracted_dir(str(tmp_path)) == str(tmp_path / "Platform-Tools-35")
+
+    def test_find_extracted_dir_missing(self, tmp_path):
+        """No matching directory yields None."""
+        (tmp_path / "other").mkdir()
+        assert _find_extracted_dir(str(tmp_path)) is None
+
+    def test_download_archive_verifies_while_streaming(self, tmp_path):
+        """A matching pinned digest accepts exactly the bytes written to disk."""
+        import hashlib
+        resp = Mock()
+        resp.iter_content.return_value = [b"abc", b"", b"def"]
+        dest = tmp_path / "tools.zip"
+        _download_archive(resp, str(dest), 1024,
+                          hashlib.sha256(b"abcdef").hexdigest().upper())
+        assert dest.read_bytes() == b"abcdef"
+
+    @patch('src.core.platform_tools.hashlib.sha256')
+    def test_download_archive_unpinned_skips_hashing(self, mock_sha256, tmp_path):
+        """Without an expected digest the download is not hashed."""
+        resp = Mock()
+        resp.iter_content.return_value = [b"abc"]
+        dest = tmp_path / "tools.zip"
+        _download_archive(resp, str(dest), 1024)
+        mock_sha256.assert_not_called()
+        assert dest.read_bytes() == b"abc"
+
+    def test_download_archive_rejects_digest_mismatch(self, tmp_path):
+        """A download that does not match the pinned digest is rejected."""
+        resp = Mock()
+        resp.iter_content.return_value = [b"tampered"]
+        with pytest.raises(RuntimeError, match="SHA-256"):
+            _download_archive(resp, str(tmp_path / "tools.zip"), 1024, "0" * 64)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -13,6 +13,16 @@ from src.core.platform_utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_directory_caches():
+    """Reset the cached directory lookups around each test."""
+    get_executable_directory.cache_clear()
+    get_platform_tools_directory.cache_clear()
+    yield
+    get_executable_directory.cache_clear()
+    get_platform_tools_directory.cache_clear()
+
+
 class TestPlatformUtils:
     """Test platform utility functions."""
     
@@ -37,19 +47,19 @@ class TestPlatformUtils:
     
     def test_get_platform_type_linux(self):
         """Test platform type detection for Linux."""
-        with patch('sys.platform', 'linux'):
+        with patch('src.core.platform_utils._PLATFORM', 'linux'):
             result = get_platform_type()
             assert result == 'linux'
     
     def test_get_platform_type_windows(self):
         """Test platform type detection for Windows."""
-        with patch('sys.platform', 'win32'):
+        with patch('src.core.platform_utils._PLATFORM', 'win32'):
             result = get_platform_type()
             assert result == 'win32'
     
     def test_get_platform_type_darwin(self):
         """Test platform type detection for macOS."""
-        with patch('sys.platform', 'darwin'):
+        with patch('src.core.platform_utils._PLATFORM', 'darwin'):
             result = get_platform_type()
             assert result == 'darwin'
     
@@ -93,4 +103,14 @@ class TestPlatformUtils:
                 with patch('os.path.exists', return_value=False):
                     result = get_platform_tools_directory()
                     expected = os.path.join('/somewhere', 'src', 'platform-tools')
-                    assert result == expected
\ No newline at end of file
+                    assert result == expected
+
+    def test_get_platform_tools_directory_cached(self):
+        """Test the src/ existence probe only runs on the first lookup."""
+        with patch.object(sys, 'frozen', False, create=True):
+            with patch('src.core.platform_utils.get_executable_directory', return_value='/project'):
+                with patch('os.path.exists', return_value=True) as mock_exists:
+                    first = get_platform_tools_directory()
+                    second = get_platform_tools_directory()
+                    assert first == second
+                    mock_exists.assert_called_once()
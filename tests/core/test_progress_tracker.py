@@ -5,7 +5,7 @@ import unittest.mock as mock
 import time
 from unittest.mock import patch, MagicMock
 
-from src.core.progress_tracker import ProgressTracker
+from src.core.progress_tracker import ProgressTracker, estimate_progress
 
 
 class TestProgressTracker:
@@ -23,7 +23,7 @@ class TestProgressTracker:
     def test_start_tracking(self):
         """Test starting progress tracking."""
         tracker = ProgressTracker()
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             tracker.start_tracking(1024)
             
             assert tracker.start_time == 1000.0
@@ -33,10 +33,10 @@ class TestProgressTracker:
     def test_update_progress_first_update(self):
         """Test first progress update."""
         tracker = ProgressTracker()
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             tracker.start_tracking(1024)
             
-        with patch('time.time', return_value=1001.0):
+        with patch('time.monotonic', return_value=1001.0):
             tracker.update_progress(512)
             
             assert tracker.transferred_bytes == 512
@@ -45,13 +45,13 @@ class TestProgressTracker:
     def test_update_progress_multiple_updates(self):
         """Test multiple progress updates."""
         tracker = ProgressTracker()
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             tracker.start_tracking(1024)
             
-        with patch('time.time', return_value=1001.0):
+        with patch('time.monotonic', return_value=1001.0):
             tracker.update_progress(256)
             
-        with patch('time.time', return_value=1002.0):
+        with patch('time.monotonic', return_value=1002.0):
             tracker.update_progress(512)
             
             assert tracker.transferred_bytes == 512
@@ -60,7 +60,7 @@ class TestProgressTracker:
     def test_update_progress_zero_time_elapsed(self):
         """Test progress update with zero time elapsed."""
         tracker = ProgressTracker()
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             tracker.start_tracking(1024)
             tracker.update_progress(512)
             
@@ -164,6 +164,14 @@ class TestProgressTracker:
         formatted = tracker.format_speed()
         assert formatted == "2.0 MB/s"
     
+    def test_format_speed_gigabytes(self):
+        """Test formatting speed in gigabytes per second."""
+        tracker = ProgressTracker()
+        tracker.current_speed = 1.5 * 1024 ** 3
+
+        formatted = tracker.format_speed()
+        assert formatted == "1.5 GB/s"
+
     def test_format_time_seconds(self):
         """Test formatting time in seconds."""
         tracker = ProgressTracker()
@@ -180,4 +188,78 @@ class TestProgressTracker:
         """Test formatting time in hours, minutes and seconds."""
         tracker = ProgressTracker()
         formatted = tracker.format_time(3661)  # 1:01:01
-        assert formatted == "01:01:01"
\ No newline at end of file
+        assert formatted == "01:01:01"
+
+    def test_update_progress_speed_uses_window(self):
+        """Test speed is measured over the sliding window, not the whole transfer."""
+        tracker = ProgressTracker()
+        with patch('time.monotonic', return_value=1000.0):
+            tracker.start_tracking(10000)
+        for now, done in [(1001.0, 100), (1002.0, 200), (1003.0, 1200)]:
+            with patch('time.monotonic', return_value=now):
+                tracker.update_progress(done)
+
+        assert tracker.current_speed == 1000.0
+
+    def test_update_progress_throttles_callback(self):
+        """Test callbacks fire on percentage change or after the push interval."""
+        tracker = ProgressTracker()
+        callback = MagicMock()
+        tracker.set_progress_callback(callback)
+        with patch('time.monotonic', return_value=1000.0):
+            tracker.start_tracking(1000)
+            tracker.update_progress(10)   # 1% -> pushed
+            tracker.update_progress(11)   # still 1%, same instant -> dropped
+            tracker.update_progress(20)   # 2% -> pushed
+        with patch('time.monotonic', return_value=1000.1):
+            tracker.update_progress(21)   # still 2%, interval elapsed -> pushed
+
+        assert [c.args[0] for c in callback.call_args_list] == [1, 2, 2]
+
+    def test_update_transfer_progress_fields(self):
+        """Test file counters are plain attributes mirrored by transfer_progress."""
+        tracker = ProgressTracker()
+        tracker.set_files_to_transfer(5)
+        tracker.update_transfer_progress(2, 5)
+
+        assert (tracker.current_file, tracker.total_files) == (2, 5)
+        assert tracker.transfer_progress == {
+            'current_file': 2, 'total_files': 5, 'files_to_transfer': 5
+        }
+
+        tracker.reset_transfer_progress()
+        assert tracker.transfer_progress == {
+            'current_file': 0, 'total_files': 0, 'files_to_transfer': 0
+        }
+
+    def test_update_transfer_progress_throttles_messages(self):
+        """Test TRANSFER_PROGRESS messages are sent per 1% of files plus completion."""
+        tracker = ProgressTracker()
+        status = MagicMock()
+        tracker.set_status_callback(status)
+        for current in range(1, 1001):
+            tracker.update_transfer_progress(current, 1000)
+
+        messages = [c.args[0] for c in status.call_args_list]
+        assert messages[0] == "TRANSFER_PROGRESS:1:1000"
+        assert messages[-1] == "TRANSFER_PROGRESS:1000:1000"
+        assert len(messages) == 101
+        assert tracker.current_file == 1000
+
+
+class TestEstimateProgress:
+    """Test the output-based progress estimator."""
+
+    def test_simple_steps_after_one_second(self):
+        """Test simple estimation waits a second then steps by 20 up to 90."""
+        assert estimate_progress(5, 0.5, 0) is None
+        assert estimate_progress(5, 1.0, 0) == 20
+        assert estimate_progress(5, 3.0, 80) == 90
+        assert estimate_progress(5, 3.0, 90) is None
+
+    def test_complex_blends_activity_and_time(self):
+        """Test complex estimation for large outputs is capped at 95."""
+        assert estimate_progress(500, 1.0, 0, complex_estimate=True) is None
+        assert estimate_progress(50, 2.0, 40, complex_estimate=True) == 50
+        assert estimate_progress(2000, 120.0, 0, complex_estimate=True) == 4
+        assert estimate_progress(90000, 6000.0, 0, complex_estimate=True) == 90
@@ -0,0 +1,147 @@
+"""Tests for the Android file browser component."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from src.gui.components.file_browser import (
+    AndroidFileBrowser,
+    _LISTING_CACHE_TTL,
+    _close_sessions,
+    _group_tree_dump,
+    _parse_listing,
+)
+
+
+class TestParseListing:
+    """Test parsing of ls -1p directory listings."""
+
+    def test_splits_folders_and_files(self):
+        """Trailing slashes mark folders; other entries are files."""
+        folders, files = _parse_listing("DCIM/\nMy Music/\nnotes.txt\nphoto 1.jpg\n")
+        assert folders == ["DCIM", "My Music"]
+        assert files == ["notes.txt", "photo 1.jpg"]
+
+    def test_skips_hidden_and_blank_entries(self):
+        """Hidden entries and blank lines are ignored."""
+        folders, files = _parse_listing("./\n../\n.thumbnails/\n.nomedia\n\nDownload/\n")
+        assert folders == ["Download"]
+        assert files == []
+
+    def test_returns_sorted_names(self):
+        """Names come back sorted whatever order the device listed them in."""
+        folders, files = _parse_listing("b.txt\nMusic/\na.txt\nDCIM/\n")
+        assert folders == ["DCIM", "Music"]
+        assert files == ["a.txt", "b.txt"]
+
+    def test_large_listing(self):
+        """Thousands of entries are split without losing any."""
+        stdout = "\n".join(f"dir{i}/" if i % 2 else f"file{i}" for i in range(5000))
+        folders, files = _parse_listing(stdout)
+        assert len(folders) == len(files) == 2500
+        assert folders[0] == "dir1" and files[0] == "file0"
+
+
+class TestGroupTreeDump:
+    """Test splitting of the find tree dump into per-folder listings."""
+
+    def test_groups_entries_by_folder(self):
+        """Each folder gets an ls -1p style listing of its own entries."""
+        stdout = "./DCIM\n./DCIM/Camera\n./Music\n__FILES__\n./a.txt\n./DCIM/Camera/1.jpg"
+        listings = _group_tree_dump("/sdcard", stdout, 3)
+        assert listings["/sdcard"] == "DCIM/\nMusic/\na.txt"
+        assert listings["/sdcard/DCIM"] == "Camera/"
+        assert listings["/sdcard/DCIM/Camera"] == "1.jpg"
+        assert listings["/sdcard/Music"] == ""
+
+    def test_skips_last_level_and_unreadable_folders(self):
+        """Folders whose contents were not dumped get no listing."""
+        stdout = (
+            "./Android\nfind: './Android': Permission denied\n"
+            "./a\n./a/b\n__FILES__\n"
+        )
+        listings = _group_tree_dump("/sdcard/", stdout, 2)
+        assert "/sdcard/Android" not in listings
+        assert "/sdcard/a/b" not in listings
+        assert listings["/sdcard/a"] == "b/"
+
+    def test_missing_marker_returns_nothing(self):
+        """Output from a failed cd is not mistaken for an empty tree."""
+        assert _group_tree_dump("/sdcard", "cd: /sdcard: No such file", 3) == {}
+
+
+class TestListingCache:
+    """Test the per-browser directory listing cache."""
+
+    def _browser(self):
+        return AndroidFileBrowser(MagicMock(), MagicMock())
+
+    def test_fresh_listing_is_served(self):
+        """A stored listing is returned for the same device and path."""
+        browser = self._browser()
+        browser._store_listing(("SERIAL", "/sdcard/DCIM"), ("a/\n", "", 0))
+
+        assert browser._get_cached_listing(("SERIAL", "/sdcard/DCIM")) == ("a/\n", "", 0)
+        assert browser._get_cached_listing(("OTHER", "/sdcard/DCIM")) is None
+
+    def test_expired_listing_is_dropped(self):
+        """Listings older than the TTL are not served."""
+        browser = self._browser()
+        with patch('src.gui.components.file_browser.time.monotonic', return_value=100.0):
+            browser._store_listing(("SERIAL", "/sdcard"), ("a/\n", "", 0))
+        with patch('src.gui.components.file_browser.time.monotonic',
+                   return_value=100.0 + _LISTING_CACHE_TTL):
+            assert browser._get_cached_listing(("SERIAL", "/sdcard")) is None
+        assert not browser._listing_cache
+
+    def test_failed_listing_is_not_cached(self):
+        """Errors are never cached so a retry asks the device again."""
+        browser = self._browser()
+        browser._store_listing(("SERIAL", "/data"), ("", "Permission denied", 1))
+        browser._store_listing(("SERIAL", "/gone"), (None, "closed", -1))
+
+        assert not browser._listing_cache
+
+    def test_clear_cache(self):
+        """clear_cache forgets every listing."""
+        browser = self._browser()
+        browser._store_listing(("SERIAL", "/sdcard"), ("a/\n", "", 0))
+        browser.clear_cache()
+
+        assert browser._get_cached_listing(("SERIAL", "/sdcard")) is None
+
+
+class TestRowIcons:
+    """Test the folder and file row icons."""
+
+    @patch('src.gui.components.file_browser.tk')
+    def test_icons_drawn_once(self, mock_tk):
+        """Both icons are created on first use and reused afterwards."""
+        browser = AndroidFileBrowser(MagicMock(), MagicMock())
+
+        icons = browser._get_icons()
+
+        assert set(icons) == {"folder", "file"}
+        assert browser._get_icons() is icons
+        assert mock_tk.PhotoImage.call_count == 2
+
+
+class TestCloseSessions:
+    """Test closing the browser's adb shell sessions."""
+
+    def test_returns_while_session_is_busy(self):
+        """A session still mid-command does not hold up the caller."""
+        release = threading.Event()
+        closed = threading.Event()
+        busy = MagicMock()
+        busy.close.side_effect = lambda: release.wait(5)
+        idle = MagicMock()
+
+        started = time.monotonic()
+        _close_sessions([busy, idle], closed.set)
+
+        assert time.monotonic() - started < 0.5
+        assert not closed.is_set()
+        release.set()
+        assert closed.wait(2)
+        idle.close.assert_called_once_with()
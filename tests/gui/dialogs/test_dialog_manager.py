@@ -0,0 +1,154 @@
+"""Tests for the dialog manager."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+from src.gui.dialogs.dialog_manager import (
+    DialogManager,
+    WRAP_DEBOUNCE_MS,
+    _TROUBLESHOOTING_STEPS,
+)
+
+
+class TestSelectionNotice:
+    """Test the file/folder selection notice dialog."""
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_resize_events_are_debounced(self, mock_tk):
+        """A burst of Configure events re-wraps the text only once."""
+        dialog = mock_tk.Toplevel.return_value
+        dialog.winfo_width.return_value = 100
+        dialog.after.side_effect = lambda delay, func: f"job-{dialog.after.call_count}"
+        text_label = mock_tk.Label.return_value
+        DialogManager(MagicMock()).show_file_folder_selection_notice()
+        on_configure = dialog.bind.call_args[0][1]
+        dialog.after.assert_called_once()
+        assert dialog.after.call_args[0][0] == 10
+        dialog.after.reset_mock()
+
+        for _ in range(3):
+            on_configure(MagicMock(widget=dialog))
+        on_configure(MagicMock(widget=text_label))
+
+        assert dialog.after.call_count == 3
+        assert dialog.after_cancel.call_count == 2
+        delay, apply_wraplength = dialog.after.call_args[0]
+        assert delay == WRAP_DEBOUNCE_MS
+        apply_wraplength()
+        text_label.config.assert_called_once_with(wraplength=200)
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_waits_on_result_variable(self, mock_tk):
+        """The dialog returns the value set by its buttons, then is destroyed."""
+        dialog = mock_tk.Toplevel.return_value
+        confirmed = mock_tk.BooleanVar.return_value
+        confirmed.get.return_value = True
+
+        assert DialogManager(MagicMock()).show_file_folder_selection_notice() is True
+
+        dialog.wait_variable.assert_called_once_with(confirmed)
+        dialog.wait_window.assert_not_called()
+        dialog.destroy.assert_called_once_with()
+        mock_tk.Button.call_args.kwargs["command"]()
+        confirmed.set.assert_called_once_with(True)
+
+
+class TestEnableDebuggingInstructions:
+    """Test the USB debugging instructions dialog."""
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_body_is_read_only_text(self, mock_tk):
+        """Instructions go into a disabled Text widget with no resize handler."""
+        dialog = mock_tk.Toplevel.return_value
+        DialogManager(MagicMock()).show_enable_debugging_instructions()
+
+        text_body = mock_tk.Text.return_value
+        assert mock_tk.Text.call_args.kwargs["wrap"] == "word"
+        text_body.insert.assert_called_once_with("1.0", _TROUBLESHOOTING_STEPS)
+        text_body.configure.assert_called_once_with(state="disabled")
+        dialog.bind.assert_not_called()
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_dialog_shown_once_built(self, mock_tk):
+        """The dialog stays withdrawn while built and is grabbed once shown."""
+        dialog = mock_tk.Toplevel.return_value
+        DialogManager(MagicMock()).show_enable_debugging_instructions()
+
+        calls = [name for name, _, _ in dialog.mock_calls]
+        assert calls[0] == "withdraw"
+        assert calls[-3:] == ["deiconify", "lift", "grab_set"]
+        dialog.update_idletasks.assert_not_called()
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_dialog_reused_between_calls(self, mock_tk):
+        """Closing hides the dialog, runs the callback, and later calls reuse it."""
+        dialog = mock_tk.Toplevel.return_value
+        manager = DialogManager(MagicMock())
+        first, second = MagicMock(), MagicMock()
+
+        manager.show_enable_debugging_instructions(first)
+        on_close = mock_tk.Button.call_args.kwargs["command"]
+        on_close()
+        manager.show_enable_debugging_instructions(second)
+        on_close()
+
+        mock_tk.Toplevel.assert_called_once()
+        dialog.destroy.assert_not_called()
+        assert dialog.withdraw.call_count == 3
+        first.assert_called_once_with()
+        second.assert_called_once_with()
+
+
+class TestTransferStats:
+    """Test the transfer statistics dialog."""
+
+    @patch('src.gui.dialogs.dialog_manager.tk')
+    def test_accepts_deduplicator(self, mock_tk):
+        """Byte counts use the deduplicator's formatting and skips are summarised."""
+        mock_ttk = sys.modules['tkinter'].ttk
+        deduplicator = MagicMock()
+        deduplicator.format_bytes.return_value = "1.5 MB"
+        stats = {'transferred': 3, 'skipped': 2, 'bytes_saved': 1572864}
+        manager = DialogManager(MagicMock())
+        mock_ttk.Style.assert_not_called()
+
+        manager.show_transfer_stats(stats, "pull", deduplicator)
+        manager.show_transfer_stats(stats, "pull", deduplicator)
+
+        mock_tk.Text.assert_not_called()
+        assert mock_ttk.Label.call_args.kwargs["style"] == "Stats.TLabel"
+        mock_ttk.Style.return_value.configure.assert_called_once_with(
+            "Stats.TLabel", font=("Courier", 10)
+        )
+        text = mock_ttk.Label.call_args.kwargs["text"]
+        assert "Bytes Saved: 1.5 MB" in text
+        assert "Duplicate detection helped avoid unnecessary transfers!" in text
+
+
+class TestBrowseLocal:
+    """Test local file/folder browsing."""
+
+    @patch.object(DialogManager, 'show_file_folder_selection_notice', return_value=True)
+    def test_picker_opens_on_idle_and_reports_via_callback(self, mock_notice):
+        """The picker is deferred to an idle callback and its result delivered."""
+        parent = MagicMock()
+        on_selected = MagicMock()
+        DialogManager(parent).browse_local_file_or_folder("pull", on_selected, "/home")
+
+        on_selected.assert_not_called()
+        ask_path = parent.after_idle.call_args[0][0]
+        with patch('tkinter.filedialog') as mock_filedialog:
+            mock_filedialog.askdirectory.return_value = "/home/photos"
+            ask_path()
+
+        on_selected.assert_called_once_with("/home/photos")
+
+    @patch.object(DialogManager, 'show_file_folder_selection_notice', return_value=False)
+    def test_cancelled_notice_reports_none(self, mock_notice):
+        """Cancelling the notice reports no selection and opens no picker."""
+        parent = MagicMock()
+        on_selected = MagicMock()
+        DialogManager(parent).browse_local_file_or_folder("push", on_selected)
+
+        on_selected.assert_called_once_with(None)
+        parent.after_idle.assert_not_called()
@@ -0,0 +1,197 @@
+"""Tests for license agreement persistence."""
+
+import builtins
+import os
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from src.gui.dialogs import license_agreement
+from src.gui.dialogs.license_agreement import (
+    check_license_agreement,
+    save_license_agreement,
+)
+
+
+@pytest.fixture
+def license_file(temp_directory):
+    """Point the license functions at a fresh file with an empty cache."""
+    path = os.path.join(temp_directory, "license_agreed.ini")
+    with patch.object(license_agreement, 'get_license_file_path', return_value=path), \
+            patch.object(license_agreement, '_license_agreed_cache', None):
+        yield path
+
+
+class TestLicenseAgreement:
+    """Test reading and saving the license agreement."""
+
+    def test_not_agreed_without_file(self, license_file):
+        """A missing file means the license has not been agreed."""
+        assert check_license_agreement() is False
+
+    def test_save_then_check(self, license_file):
+        """Saving writes the file and marks the agreement as given."""
+        assert save_license_agreement() is True
+        with open(license_file) as f:
+            assert f.read() == "1"
+        assert check_license_agreement() is True
+
+    def test_result_is_cached(self, license_file):
+        """The file is only read on the first check."""
+        with open(license_file, "w") as f:
+            f.write("1")
+        assert check_license_agreement() is True
+
+        os.remove(license_file)
+        assert check_license_agreement() is True
+
+    @patch.object(license_agreement, 'check_license_agreement')
+    def test_first_run_is_noop_off_windows(self, mock_check):
+        """Outside Windows the first-run hook does no work at all."""
+        if license_agreement.IS_WINDOWS:
+            pytest.skip("Windows-only behaviour differs")
+        license_agreement.run_windows_first_run_if_needed()
+        mock_check.assert_not_called()
+
+    def test_save_replaces_stale_temp_file(self, license_file):
+        """A temp file left by a crashed process with the same PID is replaced."""
+        parent_dir, name = os.path.split(license_file)
+        stale = os.path.join(parent_dir, f".{name}.{os.getpid()}.tmp")
+        with open(stale, "w") as f:
+            f.write("0")
+
+        assert save_license_agreement() is True
+        assert os.listdir(parent_dir) == [name]
+        with open(license_file) as f:
+            assert f.read() == "1"
+
+    def test_failed_save_removes_temp_file(self, license_file):
+        """A failed rename leaves no temporary file behind."""
+        with patch('os.replace', side_effect=OSError("denied")):
+            assert save_license_agreement() is False
+        assert os.listdir(os.path.dirname(license_file)) == []
+        assert check_license_agreement() is False
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions only")
+    def test_saved_file_is_owner_only(self, license_file):
+        """The agreement file is readable and writable by its owner only."""
+        assert save_license_agreement() is True
+        assert os.stat(license_file).st_mode & 0o777 == 0o600
+
+    def test_other_content_is_not_agreement(self, license_file):
+        """Only a leading "1" counts as agreement."""
+        with open(license_file, "w") as f:
+            f.write("0")
+        assert check_license_agreement() is False
+
+    def test_save_creates_missing_directory(self, temp_directory):
+        """The license directory is created when it does not exist yet."""
+        path = os.path.join(temp_directory, "config", "license_agreed.ini")
+        with patch.object(license_agreement, 'get_license_file_path', return_value=path), \
+                patch.object(license_agreement, '_license_agreed_cache', None):
+            assert save_license_agreement() is True
+        assert os.path.exists(path)
+
+
+class TestLicenseAgreementFrame:
+    """Test the agreement frame's button handlers."""
+
+    @patch.object(license_agreement, 'save_license_agreement')
+    @patch.object(license_agreement, 'check_license_agreement', return_value=True)
+    def test_agree_when_already_recorded_skips_save(self, mock_check, mock_save):
+        """Agreeing again only runs the callback."""
+        frame = license_agreement.LicenseAgreementFrame.__new__(
+            license_agreement.LicenseAgreementFrame
+        )
+        frame.on_agree_callback = MagicMock()
+
+        frame.on_agree()
+
+        mock_save.assert_not_called()
+        frame.on_agree_callback.assert_called_once_with()
+
+    def test_widgets_built_on_first_map_only(self):
+        """The UI is built when the frame is first mapped, not on creation."""
+        frame_cls = license_agreement.LicenseAgreementFrame
+        with patch.object(license_agreement.tk.Frame, '__init__', return_value=None), \
+                patch.object(frame_cls, 'pack'), \
+                patch.object(frame_cls, 'bind', return_value="map-binding"), \
+                patch.object(frame_cls, 'unbind') as mock_unbind, \
+                patch.object(frame_cls, 'setup_ui') as mock_setup:
+            frame = frame_cls(MagicMock(), MagicMock())
+            mock_setup.assert_not_called()
+
+            frame._build_once()
+            frame._build_once()
+
+        mock_setup.assert_called_once_with()
+        mock_unbind.assert_called_once_with("<Map>", "map-binding")
+
+    @patch('src.gui.dialogs.license_agreement.tk')
+    def test_license_text_inserted_then_locked(self, mock_tk):
+        """The deferred insert unlocks the text area only while writing."""
+        frame_cls = license_agreement.LicenseAgreementFrame
+        frame = frame_cls.__new__(frame_cls)
+        frame.license_text = MagicMock()
+
+        frame._populate_license()
+
+        frame.license_text.insert.assert_called_once_with(
+            mock_tk.END, license_agreement.get_mit_license_text()
+        )
+        assert frame.license_text.config.call_args_list[-1] == call(state=mock_tk.DISABLED)
+
+    @patch('src.gui.dialogs.license_agreement.tk')
+    def test_disagree_reuses_confirmation_dialog(self, mock_tk):
+        """The exit confirmation is built once and closes the app only when confirmed."""
+        frame_cls = license_agreement.LicenseAgreementFrame
+        frame = frame_cls.__new__(frame_cls)
+        frame._confirm_dialog = None
+        frame._confirm_result = None
+        dialog = mock_tk.Toplevel.return_value
+        confirmed = mock_tk.BooleanVar.return_value
+        confirmed.get.side_effect = [False, True]
+
+        with patch.object(frame_cls, 'winfo_toplevel', create=True) as mock_toplevel:
+            frame.on_disagree()
+            mock_toplevel.return_value.destroy.assert_not_called()
+            frame.on_disagree()
+
+        mock_tk.Toplevel.assert_called_once()
+        dialog.wait_variable.assert_called_with(confirmed)
+        assert dialog.withdraw.call_count == 3
+        mock_toplevel.return_value.destroy.assert_called_once_with()
+
+
+class TestLicenseFilePath:
+    """Test resolution of the license file location."""
+
+    def test_dev_mode_does_not_import_platformdirs(self):
+        """Running from source resolves a path without importing platformdirs."""
+        real_import = builtins.__import__
+        attempted = []
+
+        def tracking_import(name, *args, **kwargs):
+            if name == "platformdirs":
+                attempted.append(name)
+            return real_import(name, *args, **kwargs)
+
+        license_agreement.get_license_file_path.cache_clear()
+        try:
+            with patch.object(license_agreement.sys, 'frozen', False, create=True), \
+                    patch('builtins.__import__', side_effect=tracking_import):
+                path = license_agreement.get_license_file_path()
+        finally:
+            license_agreement.get_license_file_path.cache_clear()
+        assert path.endswith("dev-mode_license_agreed.ini")
+        assert attempted == []
+
+    def test_resource_path_reuses_base_dir(self):
+        """Resources resolve against a base directory computed once."""
+        license_agreement._resource_base_dir.cache_clear()
+        first = license_agreement.resource_path(os.path.join("scripts", "a.ps1"))
+        second = license_agreement.resource_path("b.txt")
+
+        base = os.path.dirname(second)
+        assert first == os.path.join(base, "scripts", "a.ps1")
+        assert license_agreement._resource_base_dir.cache_info().misses == 1
@@ -0,0 +1,79 @@
+"""Tests for the animation handler."""
+
+from unittest.mock import MagicMock
+
+from src.gui.handlers.animation_handler import AnimationHandler, ANIMATION_INTERVAL_MS
+
+
+class TestAnimationHandler:
+    """Test status animation updates."""
+
+    def test_status_update_sets_label_text_without_flush(self):
+        """Animation frames go through the status label without forcing a redraw."""
+        parent = MagicMock()
+        handler = AnimationHandler(parent)
+
+        handler._update_status_label("Transferring.")
+
+        parent.status_label.set_text.assert_called_once_with("Transferring.")
+        parent.update_idletasks.assert_not_called()
+
+    def test_transfer_frames_cycle(self):
+        """Transfer frames cycle through one to five dots and wrap around."""
+        parent = MagicMock()
+        handler = AnimationHandler(parent)
+        handler.animation_job = "job"
+
+        for _ in range(6):
+            handler._animate_transfer_text()
+
+        texts = [c.args[0] for c in parent.status_label.set_text.call_args_list]
+        assert texts == ["Transferring.", "Transferring..", "Transferring...",
+                         "Transferring....", "Transferring.....", "Transferring."]
+
+    def test_transfer_frames_include_file_counts(self):
+        """File progress is shown alongside the dot frame."""
+        parent = MagicMock()
+        handler = AnimationHandler(parent)
+        handler.animation_job = "job"
+        handler.update_transfer_progress(3, 10)
+
+        handler._animate_transfer_text()
+
+        parent.status_label.set_text.assert_called_once_with("Transferring 3 of 10 files.")
+
+    def test_identical_status_skipped_until_stop(self):
+        """Repeated text is written once; stopping forgets the last text."""
+        parent = MagicMock()
+        handler = AnimationHandler(parent)
+
+        handler._update_status_label("Transferring.")
+        handler._update_status_label("Transferring.")
+        assert parent.status_label.set_text.call_count == 1
+
+        handler.stop_animation()
+        handler._update_status_label("Transferring.")
+        assert parent.status_label.set_text.call_count == 2
+
+    def test_single_driver_dispatches_to_enabled_animation(self):
+        """One periodic tick renders frames without arming per-frame timers."""
+        parent = MagicMock()
+        handler = AnimationHandler(parent)
+        parent.after.assert_called_once_with(ANIMATION_INTERVAL_MS, handler._tick)
+
+        handler.start_scanning_animation()
+        handler._tick()
+        handler._tick()
+        handler.stop_animation()
+        handler._tick()
+
+        texts = [c.args[0] for c in parent.status_label.set_text.call_args_list]
+        assert texts == ["Scanning for duplicates.", "Scanning for duplicates.."]
+        assert parent.after.call_count == 4
+        parent.after_cancel.assert_not_called()
+        assert not handler.is_animation_running()
+
+    def test_instances_have_no_dict(self):
+        """Handler state lives in fixed slots."""
+        handler = AnimationHandler(MagicMock())
+        assert not hasattr(handler, "__dict__")
@@ -0,0 +1,53 @@
+"""Tests for the progress handler."""
+
+from unittest.mock import MagicMock
+
+from src.gui.progress_handler import ProgressHandler, UI_FLUSH_INTERVAL_MS
+
+
+class TestProgressHandler:
+    """Test coalescing of progress and status updates."""
+
+    def test_updates_coalesce_into_one_flush(self):
+        """Bursts of updates schedule a single flush that applies the latest values."""
+        parent = MagicMock()
+        status_label = MagicMock()
+        handler = ProgressHandler(parent, MagicMock(), status_label)
+
+        for pct in range(50):
+            handler.update_progress(pct)
+            handler.set_status(f"Status: {pct}%")
+
+        parent.after.assert_called_once_with(UI_FLUSH_INTERVAL_MS, handler._flush_ui)
+        handler._flush_ui()
+
+        status_label.config.assert_called_once_with(text="Status: 49%")
+        assert handler._last_percentage == 49.0
+        parent.update_idletasks.assert_not_called()
+
+    def test_flush_allows_next_schedule(self):
+        """After a flush, the next update schedules a new tick."""
+        parent = MagicMock()
+        handler = ProgressHandler(parent, MagicMock(), MagicMock())
+
+        handler.update_progress(10)
+        handler._flush_ui()
+        handler.update_progress(20)
+
+        assert parent.after.call_count == 2
+
+    def test_byte_counters_converted_on_flush(self):
+        """Raw byte counters are stored and turned into a percentage on flush."""
+        handler = ProgressHandler(MagicMock(), MagicMock(), MagicMock())
+
+        handler.update_progress(512, 2048)
+        assert handler._pending_progress == (512, 2048)
+        handler._flush_ui()
+
+        assert handler._last_percentage == 25.0
+
+    def test_to_percentage_clamps(self):
+        """Percentages are clamped and zero totals are safe."""
+        assert ProgressHandler._to_percentage(150, None) == 100.0
+        assert ProgressHandler._to_percentage(10, 0) == 0.0
+        assert ProgressHandler._to_percentage(3000, 2000) == 100.0
@@ -105,6 +105,23 @@ class TestDeviceManager:
         assert device_manager.device_connected is True
         device_manager.adb_manager.check_device.assert_called_once()
     
+    def test_get_cached_device_reuses_recent_check(self, device_manager):
+        """A device check within the TTL is reused without calling adb."""
+        device_manager.adb_manager.check_device.return_value = "ABC123"
+        device_manager.check_device_connection()
+
+        assert device_manager.get_cached_device() == "ABC123"
+        device_manager.adb_manager.check_device.assert_called_once()
+
+    def test_get_cached_device_refreshes_when_stale(self, device_manager):
+        """An expired check result triggers a fresh adb query."""
+        device_manager.adb_manager.check_device.return_value = "ABC123"
+        with patch('src.managers.device_manager.time.monotonic', side_effect=[100.0, 103.0, 103.0]):
+            device_manager.check_device_connection()
+            assert device_manager.get_cached_device(ttl=2.0) == "ABC123"
+
+        assert device_manager.adb_manager.check_device.call_count == 2
+
     def test_check_device_connection_not_connected(self, device_manager):
         """Test device connection check when device is not connected."""
         device_manager.adb_manager.check_device.return_value = None